@@ -8,9 +8,14 @@ This example demonstrates the basic usage of Kizuna Python bindings:
 - Shutting down
 """
 
-import asyncio
+import sys
 from kizuna import Kizuna
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 
 async def main():
     """Main function demonstrating basic Kizuna usage."""
@@ -24,17 +29,38 @@ async def main():
         print("\nDiscovering peers...")
         peers = await kizuna.discover_peers()
         
-        print(f"Found {len(peers)} peer(s):")
-        for peer in peers:
-            print(f"  - {peer.name}")
-            print(f"    ID: {peer.id}")
-            print(f"    Addresses: {', '.join(peer.addresses)}")
-            print(f"    Capabilities: {', '.join(peer.capabilities)}")
-            print(f"    Discovery method: {peer.discovery_method}")
-            print()
+        # Build the whole peer listing from the columns and write it once
+        sys.stdout.write(f"Found {len(peers)} peer(s):\n" + "".join([
+            f"  - {name}\n"
+            f"    ID: {peer_id}\n"
+            f"    Addresses: {addresses}\n"
+            f"    Capabilities: {', '.join(capabilities)}\n"
+            f"    Discovery method: {method}\n"
+            f"\n"
+            for peer_id, name, addresses, capabilities, method in zip(
+                peers.ids,
+                peers.names,
+                peers.addresses_str,
+                peers.capabilities,
+                peers.discovery_methods,
+            )
+        ]))
+        sys.stdout.flush()
         
-        # Connect to the first peer if available
-        if peers:
+        # Connect to every peer at once when several were found
+        if len(peers) > 1:
+            print(f"Connecting to {len(peers)} peers...")
+            
+            connections = await kizuna.connect_to_peers(
+                peers.ids,
+                return_exceptions=True,
+            )
+            for peer, connection in zip(peers, connections):
+                if isinstance(connection, RuntimeError):
+                    print(f"Failed to connect to {peer.name}: {connection}")
+                else:
+                    print(f"Successfully connected to {connection.peer_id}")
+        elif peers:
             peer_id = peers[0].id
             print(f"Connecting to peer: {peers[0].name}...")
             
@@ -57,4 +83,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
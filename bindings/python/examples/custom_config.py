@@ -2,13 +2,24 @@
 Custom Configuration Example
 
 This example demonstrates how to use custom configuration options with Kizuna.
+A single instance is built with the default configuration and reconfigured
+for the later examples.
 """
 
-import asyncio
-from kizuna import Kizuna
+import sys
+from kizuna import Kizuna, KizunaConfig
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
 
-async def main():
+
+# Peer IDs trusted by the high-security example
+ALLOWLISTED_PEER_IDS = ["alice-laptop", "bob-workstation"]
+
+
+async def main(kizuna: Kizuna):
     """Main function demonstrating custom configuration."""
     
     # Create a custom configuration
@@ -39,7 +50,7 @@ async def main():
         }
     }
     
-    print("Initializing Kizuna with custom configuration...")
+    print("Applying custom configuration...")
     print("\nConfiguration:")
     print(f"  Device name: {config['identity']['device_name']}")
     print(f"  User name: {config['identity']['user_name']}")
@@ -47,16 +58,25 @@ async def main():
     print(f"  Trust mode: {config['security']['trust_mode']}")
     print(f"  Listen port: {config['networking']['listen_port']}")
     
-    kizuna = Kizuna(config)
+    # Parse and validate once; bad keys are reported by name
+    try:
+        parsed = KizunaConfig.from_dict(config)
+    except (TypeError, ValueError) as e:
+        print(f"Invalid configuration: {e}")
+        return
+    
+    await kizuna.reconfigure(parsed)
     
     try:
         print("\nDiscovering peers...")
         peers = await kizuna.discover_peers()
         
-        print(f"Found {len(peers)} peer(s):")
-        for peer in peers:
-            print(f"  - {peer.name} ({peer.id})")
-            print(f"    Discovery method: {peer.discovery_method}")
+        sys.stdout.write(f"Found {len(peers)} peer(s):\n" + "".join([
+            f"  - {name} ({peer_id})\n"
+            f"    Discovery method: {method}\n"
+            for peer_id, name, method in zip(peers.ids, peers.names, peers.discovery_methods)
+        ]))
+        sys.stdout.flush()
         
         if not peers:
             print("\nNo peers found. This could be because:")
@@ -66,14 +86,9 @@ async def main():
     
     except RuntimeError as e:
         print(f"Error: {e}")
-    
-    finally:
-        print("\nShutting down...")
-        await kizuna.shutdown()
-        print("Done!")
 
 
-async def high_security_config():
+async def high_security_config(kizuna: Kizuna):
     """Example of a high-security configuration."""
     
     config = {
@@ -105,34 +120,45 @@ async def high_security_config():
     print("  - UDP broadcast: Disabled")
     print("  - QUIC only: Enabled")
     
-    kizuna = Kizuna(config)
+    await kizuna.reconfigure(KizunaConfig.from_dict(config))
     
-    try:
-        peers = await kizuna.discover_peers()
-        print(f"\nFound {len(peers)} trusted peer(s)")
-    finally:
-        await kizuna.shutdown()
+    # Keep only allowlisted peers; the filter runs in Rust
+    peers = await kizuna.discover_peers()
+    trusted = peers.filter(ids=ALLOWLISTED_PEER_IDS)
+    print(f"\nFound {len(trusted)} trusted peer(s) out of {len(peers)}")
 
 
-async def minimal_config():
+async def minimal_config(kizuna: Kizuna):
     """Example of minimal configuration (uses defaults)."""
     
+    # The instance was built without a configuration, so it already uses the defaults
     print("Using minimal configuration (defaults)...")
+    
+    peers = await kizuna.discover_peers()
+    print(f"Found {len(peers)} peer(s) with default settings")
+
+
+async def run_all():
+    """Run every configuration example on one Kizuna instance."""
+    
+    print("Initializing Kizuna...")
     kizuna = Kizuna()
     
     try:
-        peers = await kizuna.discover_peers()
-        print(f"Found {len(peers)} peer(s) with default settings")
+        print("\n=== Minimal Configuration ===\n")
+        await minimal_config(kizuna)
+        
+        print("\n\n=== Custom Configuration Example ===\n")
+        await main(kizuna)
+        
+        print("\n\n=== High Security Configuration ===\n")
+        await high_security_config(kizuna)
+    
     finally:
+        print("\nShutting down...")
         await kizuna.shutdown()
+        print("Done!")
 
 
 if __name__ == "__main__":
-    print("=== Custom Configuration Example ===\n")
-    asyncio.run(main())
-    
-    print("\n\n=== High Security Configuration ===\n")
-    asyncio.run(high_security_config())
-    
-    print("\n\n=== Minimal Configuration ===\n")
-    asyncio.run(minimal_config())
+    run(run_all())
@@ -4,11 +4,21 @@ File Transfer Example
 This example demonstrates how to transfer files between peers using Kizuna.
 """
 
-import asyncio
+import stat
 import sys
 from pathlib import Path
 from kizuna import Kizuna
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+
+CHUNK_SIZE = 256 * 1024
+ZERO_COPY_THRESHOLD = 64 * 1024
+BLOCKING_READ_THRESHOLD = 1024 * 1024
+
 
 async def transfer_file(file_path: str, peer_name: str = None):
     """
@@ -19,72 +29,93 @@ async def transfer_file(file_path: str, peer_name: str = None):
         peer_name: Optional name of the peer to transfer to (uses first peer if not specified)
     """
     
-    # Validate file exists
     path = Path(file_path)
-    if not path.exists():
+    
+    # Validate the file with a single non-blocking stat before starting Kizuna
+    try:
+        st = await Kizuna.astat(str(path))
+    except FileNotFoundError:
         print(f"Error: File not found: {file_path}")
         return
     
-    if not path.is_file():
+    if not stat.S_ISREG(st.mode):
         print(f"Error: Not a file: {file_path}")
         return
     
-    print(f"Preparing to transfer: {path.name} ({path.stat().st_size} bytes)")
+    file_size = st.size
+    print(f"Preparing to transfer: {path.name} ({file_size} bytes)")
     
     # Initialize Kizuna
-    print("\nInitializing Kizuna...")
+    print("Initializing Kizuna...")
     kizuna = Kizuna({
         "identity": {
             "device_name": "Python File Transfer Client"
+        },
+        "networking": {
+            "pool_size_per_peer": 8
         }
     })
     
     try:
-        # Discover peers
-        print("Discovering peers...")
-        peers = await kizuna.discover_peers()
-        
-        if not peers:
-            print("No peers found. Make sure another Kizuna instance is running.")
-            return
-        
-        print(f"Found {len(peers)} peer(s):")
-        for i, peer in enumerate(peers):
-            print(f"  {i + 1}. {peer.name} ({peer.id})")
+        # Send options; keep more chunks in flight for larger files
+        options = {
+            "queue_depth": max(8, min(256, file_size // CHUNK_SIZE)),
+            "chunk_size": CHUNK_SIZE,
+            "backend": "auto",
+            # Large files skip the userspace copy where the kernel can send them
+            "zero_copy": file_size > ZERO_COPY_THRESHOLD,
+            "force_async": file_size > BLOCKING_READ_THRESHOLD,
+            # The send pipeline does not encrypt the file
+            "unencrypted": True,
+        }
         
-        # Select peer
-        target_peer = None
         if peer_name:
-            # Find peer by name
-            for peer in peers:
-                if peer.name == peer_name:
-                    target_peer = peer
-                    break
-            if not target_peer:
-                print(f"Peer '{peer_name}' not found.")
+            # Discover, connect and start the transfer in a single call
+            print(f"Starting transfer of {path.name} to {peer_name}...")
+            try:
+                handle = await kizuna.transfer_file_to_name(peer_name, str(path), **options)
+            except RuntimeError as e:
+                print(f"Could not transfer to '{peer_name}': {e}")
                 return
+            print(f"Transfer started: {handle.transfer_id}")
+            print("Transfer in progress...")
+            
+            # Resolves once the transfer has finished sending
+            bytes_sent = await handle.done()
         else:
+            # Discover peers
+            print("Discovering peers...")
+            peers = await kizuna.discover_peers()
+            
+            if not peers:
+                print("No peers found. Make sure another Kizuna instance is running.")
+                return
+            
+            sys.stdout.write(f"Found {len(peers)} peer(s):\n" + "".join([
+                f"  {i}. {name} ({peer_id})\n"
+                for i, (peer_id, name) in enumerate(zip(peers.ids, peers.names), start=1)
+            ]))
+            sys.stdout.flush()
+            
             # Use first peer
             target_peer = peers[0]
+            print(f"\nTransferring to: {target_peer.name}")
+            
+            # Lease a pooled connection; it is returned to the pool on exit
+            print("Connecting...")
+            async with kizuna.with_connection(target_peer.id) as conn:
+                print(f"Connected to {conn.peer_id}")
+                
+                # Send over the leased connection
+                print(f"Starting transfer of {path.name}...")
+                handle = await conn.transfer_file(str(path), **options)
+                print(f"Transfer started: {handle.transfer_id}")
+                print("Transfer in progress...")
+                
+                # Resolves once the transfer has finished sending
+                bytes_sent = await handle.done()
         
-        print(f"\nTransferring to: {target_peer.name}")
-        
-        # Connect to peer
-        print("Connecting...")
-        connection = await kizuna.connect_to_peer(target_peer.id)
-        print(f"Connected to {connection.peer_id}")
-        
-        # Start file transfer
-        print(f"Starting transfer of {path.name}...")
-        handle = await kizuna.transfer_file(str(path), target_peer.id)
-        print(f"Transfer started: {handle.transfer_id}")
-        print("Transfer in progress...")
-        
-        # In a real application, you would monitor progress here
-        # For now, we just wait a bit
-        await asyncio.sleep(2)
-        
-        print("Transfer initiated successfully!")
+        print(f"Transfer completed successfully! ({bytes_sent} bytes sent)")
         print(f"Transfer ID: {handle.transfer_id}")
         
     except RuntimeError as e:
@@ -113,4 +144,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -8,6 +8,11 @@ import asyncio
 import sys
 from kizuna import Kizuna
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 
 async def start_streaming(stream_type: str, quality: int = 80):
     """
@@ -48,20 +53,17 @@ async def start_streaming(stream_type: str, quality: int = 80):
             print("No peers found. Make sure another Kizuna instance is running.")
             return
         
-        print(f"Found {len(peers)} peer(s):")
-        for i, peer in enumerate(peers):
-            print(f"  {i + 1}. {peer.name} ({peer.id})")
+        sys.stdout.write(f"Found {len(peers)} peer(s):\n" + "".join([
+            f"  {i}. {name} ({peer_id})\n"
+            for i, (peer_id, name) in enumerate(zip(peers.ids, peers.names), start=1)
+        ]))
+        sys.stdout.flush()
         
         # Use first peer
         target_peer = peers[0]
         print(f"\nStreaming to: {target_peer.name}")
         
-        # Connect to peer
-        print("Connecting...")
-        connection = await kizuna.connect_to_peer(target_peer.id)
-        print(f"Connected to {connection.peer_id}")
-        
-        # Start stream
+        # Start stream; it sets up its own connection to the peer
         print(f"Starting {stream_type} stream...")
         handle = await kizuna.start_stream(stream_type, target_peer.id, quality)
         print(f"Stream started: {handle.stream_id}")
@@ -110,4 +112,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -5,7 +5,7 @@ This module provides Python bindings for the Kizuna peer-to-peer communication l
 Kizuna enables secure device discovery, file transfer, media streaming, and remote command execution.
 """
 
-from typing import Optional, List, Dict, Any, AsyncIterator
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterator, Union, overload
 from typing_extensions import Literal
 
 class Kizuna:
@@ -36,15 +36,16 @@ class Kizuna:
         ```
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(self, config: Optional[Union[KizunaConfig, Dict[str, Any]]] = None) -> None:
         """
         Initialize a new Kizuna instance.
         
         Args:
-            config: Optional configuration dictionary. If not provided, uses default configuration.
-                   See KizunaConfig for available options.
+            config: Optional KizunaConfig or configuration dictionary. If not provided,
+                   uses default configuration. See KizunaConfig for available options.
         
         Raises:
+            TypeError: If a configuration value has the wrong type.
             RuntimeError: If initialization fails or configuration is invalid.
         
         Example:
@@ -72,15 +73,16 @@ class Kizuna:
         """
         ...
     
-    async def discover_peers(self) -> List[PeerInfo]:
+    async def discover_peers(self) -> PeerList:
         """
         Discover peers on the local network.
         
         This method initiates peer discovery using configured discovery methods
-        (mDNS, UDP broadcast, Bluetooth) and returns a list of discovered peers.
+        (mDNS, UDP broadcast, Bluetooth) and returns the discovered peers.
         
         Returns:
-            List of PeerInfo objects representing discovered peers.
+            PeerList of discovered peers. It supports len(), indexing and
+            iteration like a list, and exposes each field as a column.
         
         Raises:
             RuntimeError: If discovery fails or the system is not initialized.
@@ -94,6 +96,28 @@ class Kizuna:
         """
         ...
     
+    def find_peer(self, name: str) -> Optional[PeerInfo]:
+        """
+        Look up a peer by name in the latest discover_peers() result.
+        
+        The lookup uses the name index of the PeerList, so it does not loop
+        over peers in Python.
+        
+        Args:
+            name: Human-readable peer name.
+        
+        Returns:
+            PeerInfo of the first peer with that name, or None if there is no
+            such peer or discover_peers() has not been called yet.
+        
+        Example:
+            ```python
+            await kizuna.discover_peers()
+            peer = kizuna.find_peer("Alice's Laptop")
+            ```
+        """
+        ...
+    
     async def connect_to_peer(self, peer_id: str) -> PeerConnection:
         """
         Establish a connection to a peer.
@@ -117,28 +141,174 @@ class Kizuna:
         """
         ...
     
-    async def transfer_file(self, file_path: str, peer_id: str) -> TransferHandle:
+    @overload
+    async def connect_to_peers(
+        self,
+        peer_ids: List[str],
+        return_exceptions: Literal[False] = False
+    ) -> List[PeerConnection]:
+        """
+        Establish connections to several peers at once.
+        
+        All connection attempts run concurrently inside a single native task,
+        which is cheaper than gathering many connect_to_peer calls.
+        
+        Args:
+            peer_ids: Unique identifiers of the peers to connect to.
+            return_exceptions: If True, failed connections are returned as
+                               RuntimeError instances in place of their
+                               PeerConnection instead of raising (default: False).
+        
+        Returns:
+            PeerConnection objects in the same order as peer_ids; with
+            return_exceptions, a RuntimeError in place of each failed one.
+        
+        Raises:
+            RuntimeError: If any connection fails and return_exceptions is False.
+        
+        Example:
+            ```python
+            connections = await kizuna.connect_to_peers([p.id for p in peers])
+            ```
+        """
+        ...
+    
+    @overload
+    async def connect_to_peers(
+        self,
+        peer_ids: List[str],
+        return_exceptions: bool
+    ) -> List[Union[PeerConnection, RuntimeError]]: ...
+    
+    def with_connection(self, peer_id: str) -> PooledConnection:
+        """
+        Lease a pooled connection to a peer.
+        
+        Connections are pooled per peer and reused across transfers, so
+        repeated transfers skip the connection handshake. Transfers started
+        with PooledConnection.transfer_file run over the leased connection. At most
+        networking.pool_size_per_peer leases per peer are held at once; entering
+        the context waits while all of them are in use.
+        
+        Args:
+            peer_id: The unique identifier of the peer to connect to.
+        
+        Returns:
+            PooledConnection async context manager. The connection is returned
+            to the pool on exit, or dropped if the block raised.
+        
+        Raises:
+            RuntimeError: On entering, if connection fails or peer is not reachable.
+        
+        Example:
+            ```python
+            async with kizuna.with_connection(peer.id) as conn:
+                handle = await conn.transfer_file("file.txt", unencrypted=True)
+                await handle.done()
+            ```
+        """
+        ...
+    
+    async def transfer_file(
+        self,
+        file_path: str,
+        peer_id: str,
+        queue_depth: int = 64,
+        chunk_size: int = 256 * 1024,
+        backend: Literal["auto", "pipeline", "sendfile", "splice"] = "auto",
+        zero_copy: bool = False,
+        pipe_size: Optional[int] = None,
+        force_async: bool = False,
+        unencrypted: bool = False
+    ) -> TransferHandle:
         """
         Transfer a file to a peer.
         
+        The file is read ahead in chunks while earlier chunks are being sent, and
+        every chunk that is ready is coalesced into a single write to the peer.
+        The bytes are sent as-is, without chunk framing or encryption.
+        
         Args:
             file_path: Path to the file to transfer.
             peer_id: The unique identifier of the destination peer.
+            queue_depth: Maximum number of chunks read ahead of the sender (default: 64).
+            chunk_size: Size of each chunk in bytes (default: 256 KiB).
+            backend: How file data reaches the connection. "auto" and "pipeline"
+                     read chunks in userspace first, so all the options above
+                     apply. "sendfile" and "splice" copy inside the kernel and
+                     ignore queue_depth and chunk_size; they fail on
+                     transports without kernel copies (default: "auto").
+            zero_copy: With the "auto" backend, copy the file to the socket
+                       inside the kernel (sendfile) where the transport supports
+                       it, and use the pipeline elsewhere (default: False).
+            pipe_size: Minimum pipe size in bytes for the splice backend
+                       (default: kernel default).
+            force_async: Read the file on a dedicated blocking thread. Files on
+                         network, FUSE and ZFS mounts are always read this way
+                         (default: False).
+            unencrypted: Allow sending the file unencrypted. Required unless
+                         encryption is disabled in the security configuration
+                         (default: False).
         
         Returns:
             TransferHandle object for monitoring and controlling the transfer.
         
         Raises:
-            RuntimeError: If transfer fails to start or file doesn't exist.
+            RuntimeError: If transfer fails to start, file doesn't exist, or
+                          encryption is enabled and unencrypted is not set.
+            ValueError: If queue_depth, chunk_size or pipe_size is not positive,
+                        or backend is unknown.
         
         Example:
             ```python
-            handle = await kizuna.transfer_file("/path/to/file.txt", peer_id)
+            handle = await kizuna.transfer_file("/path/to/file.txt", peer_id, unencrypted=True)
             print(f"Transfer started: {handle.transfer_id}")
             ```
         """
         ...
     
+    async def transfer_file_to_name(
+        self,
+        name: str,
+        file_path: str,
+        queue_depth: int = 64,
+        chunk_size: int = 256 * 1024,
+        backend: Literal["auto", "pipeline", "sendfile", "splice"] = "auto",
+        zero_copy: bool = False,
+        pipe_size: Optional[int] = None,
+        force_async: bool = False,
+        unencrypted: bool = False
+    ) -> TransferHandle:
+        """
+        Discover a peer by name, connect to it and start a file transfer.
+        
+        The discover, connect and transfer steps run natively as one call
+        instead of three separate awaits. The pooled connection to the peer
+        stays leased until the transfer has finished.
+        
+        Args:
+            name: Human-readable name of the destination peer.
+            file_path: Path to the file to transfer.
+            queue_depth, chunk_size, backend, zero_copy, pipe_size, force_async,
+            unencrypted: Send options, as for transfer_file.
+        
+        Returns:
+            TransferHandle object for monitoring and controlling the transfer.
+        
+        Raises:
+            RuntimeError: If no peer has that name, or connecting or starting
+                          the transfer fails.
+            ValueError: If queue_depth, chunk_size or pipe_size is not positive,
+                        or backend is unknown.
+        
+        Example:
+            ```python
+            handle = await kizuna.transfer_file_to_name("Alice's Laptop", "report.pdf", unencrypted=True)
+            await handle.done()
+            ```
+        """
+        ...
+    
     async def start_stream(
         self, 
         stream_type: Literal["camera", "screen", "audio"], 
@@ -192,18 +362,54 @@ class Kizuna:
         """
         ...
     
-    async def subscribe_events(self) -> List[KizunaEvent]:
+    @staticmethod
+    async def astat(path: str) -> FileStat:
+        """
+        Stat a file without blocking the event loop.
+        
+        The file type, permissions and size are fetched with a single lookup
+        on a background thread. No instance is needed, so files can be
+        checked before Kizuna(...) starts the core systems.
+        
+        Args:
+            path: Path to the file.
+        
+        Returns:
+            FileStat with the file's mode and size.
+        
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            PermissionError: If the path cannot be accessed.
+        
+        Example:
+            ```python
+            import stat
+            
+            st = await Kizuna.astat("document.pdf")
+            if stat.S_ISREG(st.mode):
+                print(f"{st.size} bytes")
+            ```
+        """
+        ...
+    
+    async def subscribe_events(self, max_events: int = 256) -> List[KizunaEvent]:
         """
         Subscribe to Kizuna events.
         
-        Returns a list of events that have occurred. For real-time event monitoring,
-        consider implementing a polling mechanism or event callback system.
+        Waits for the next event and returns it together with every event that
+        is already queued, so a burst of events resolves a single awaitable.
+        Successive calls share one subscription, so no events are missed between
+        batches.
+        
+        Args:
+            max_events: Maximum number of events returned per call (default: 256).
         
         Returns:
             List of KizunaEvent objects.
         
         Raises:
             RuntimeError: If event subscription fails.
+            ValueError: If max_events is not positive.
         
         Example:
             ```python
@@ -214,6 +420,28 @@ class Kizuna:
         """
         ...
     
+    async def reconfigure(self, config: Optional[Union[KizunaConfig, Dict[str, Any]]] = None) -> None:
+        """
+        Apply a new configuration to the running instance.
+        
+        Every core system is rebuilt from the new configuration, as when
+        constructing an instance; only the tokio runtime, event subscriptions
+        and the transfer buffer pool are kept.
+        
+        Args:
+            config: KizunaConfig or configuration dictionary, as for the constructor.
+                    If None, default configuration is used.
+        
+        Raises:
+            RuntimeError: If the configuration is invalid or the instance is shutting down.
+        
+        Example:
+            ```python
+            await kizuna.reconfigure({"discovery": {"enable_udp": False}})
+            ```
+        """
+        ...
+    
     async def shutdown(self) -> None:
         """
         Shutdown the Kizuna instance and clean up resources.
@@ -232,14 +460,84 @@ class Kizuna:
         ...
 
 
+class PeerList:
+    """
+    Discovered peers stored column by column.
+    
+    Indexing or iterating yields PeerInfo views; the column attributes return
+    one field for every peer at once.
+    
+    Attributes:
+        ids: Peer identifiers.
+        names: Human-readable peer names.
+        addresses: Network addresses of each peer.
+        addresses_str: Comma-joined addresses of each peer, formatted once
+                       and cached for display.
+        capabilities: Capabilities of each peer.
+        discovery_methods: Method used to discover each peer.
+    """
+    
+    ids: List[str]
+    names: List[str]
+    addresses: List[List[str]]
+    addresses_str: List[str]
+    capabilities: List[List[str]]
+    discovery_methods: List[str]
+    
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> PeerInfo: ...
+    def __iter__(self) -> Iterator[PeerInfo]: ...
+    
+    def find(self, name: str) -> Optional[PeerInfo]:
+        """
+        Look up the first peer with the given name.
+        
+        Args:
+            name: Human-readable peer name.
+        
+        Returns:
+            PeerInfo view of the peer, or None if no peer has that name.
+        """
+        ...
+    
+    def filter(
+        self,
+        ids: Optional[List[str]] = None,
+        discovery_method: Optional[str] = None,
+        capability: Optional[str] = None
+    ) -> PeerList:
+        """
+        Select the peers matching every given criterion.
+        
+        The selection runs natively, without a Python loop over the peers.
+        
+        Args:
+            ids: Keep only peers whose ID is in this allowlist.
+            discovery_method: Keep only peers discovered with this method.
+            capability: Keep only peers that have this capability.
+        
+        Returns:
+            New PeerList holding the matching peers in their original order.
+        
+        Example:
+            ```python
+            trusted = peers.filter(ids=["alice-laptop", "bob-workstation"])
+            ```
+        """
+        ...
+    
+    def __repr__(self) -> str: ...
+
+
 class PeerInfo:
     """
-    Information about a discovered peer.
+    Information about a discovered peer, viewed from its PeerList.
     
     Attributes:
         id: Unique identifier for the peer.
         name: Human-readable name of the peer.
         addresses: List of network addresses where the peer can be reached.
+        addresses_str: Comma-joined addresses, cached for display.
         capabilities: List of capabilities supported by the peer.
         discovery_method: Method used to discover this peer (e.g., "mdns", "udp").
     """
@@ -247,6 +545,7 @@ class PeerInfo:
     id: str
     name: str
     addresses: List[str]
+    addresses_str: str
     capabilities: List[str]
     discovery_method: str
     
@@ -266,6 +565,53 @@ class PeerConnection:
     def __repr__(self) -> str: ...
 
 
+class PooledConnection:
+    """
+    Connection leased from the per-peer pool by Kizuna.with_connection.
+    
+    Attributes:
+        peer_id: Unique identifier of the connected peer.
+    """
+    
+    peer_id: str
+    
+    async def __aenter__(self) -> PooledConnection: ...
+    
+    async def transfer_file(
+        self,
+        file_path: str,
+        queue_depth: int = 64,
+        chunk_size: int = 256 * 1024,
+        backend: Literal["auto", "pipeline", "sendfile", "splice"] = "auto",
+        zero_copy: bool = False,
+        pipe_size: Optional[int] = None,
+        force_async: bool = False,
+        unencrypted: bool = False
+    ) -> TransferHandle:
+        """
+        Transfer a file over the leased connection.
+        
+        Options are as for Kizuna.transfer_file. The connection goes back to
+        the pool once the block has exited and the transfer has finished.
+        Only one transfer runs on the connection at a time.
+        
+        Raises:
+            RuntimeError: If used outside the `async with` block, another
+                          transfer is still running on the connection, or
+                          the transfer fails to start.
+        """
+        ...
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[type] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[Any] = None
+    ) -> bool: ...
+    
+    def __repr__(self) -> str: ...
+
+
 class TransferHandle:
     """
     Handle for monitoring and controlling a file transfer.
@@ -276,6 +622,24 @@ class TransferHandle:
     
     transfer_id: str
     
+    async def done(self) -> int:
+        """
+        Wait for the transfer to finish.
+        
+        Returns:
+            Number of bytes sent.
+        
+        Raises:
+            RuntimeError: If the transfer failed.
+        """
+        ...
+    
+    def is_done(self) -> bool:
+        """
+        Check whether the transfer has finished, successfully or not.
+        """
+        ...
+    
     def __repr__(self) -> str: ...
 
 
@@ -324,6 +688,21 @@ class KizunaEvent:
     def __repr__(self) -> str: ...
 
 
+class FileStat:
+    """
+    File metadata returned by Kizuna.astat.
+    
+    Attributes:
+        mode: File type and permission bits, compatible with the stat module.
+        size: File size in bytes.
+    """
+    
+    mode: int
+    size: int
+    
+    def __repr__(self) -> str: ...
+
+
 class TransferProgress:
     """
     Progress information for a file transfer.
@@ -356,15 +735,40 @@ class TransferProgress:
 
 class KizunaConfig:
     """
-    Configuration for Kizuna instance.
+    Parsed and validated configuration for a Kizuna instance.
     
-    This is a TypedDict-style configuration object passed to Kizuna.__init__().
+    Built from a configuration dictionary with optional "identity",
+    "discovery", "security" and "networking" sections (see IdentityConfig,
+    DiscoveryConfig, SecurityConfig and NetworkConfig). A KizunaConfig can be
+    passed to Kizuna() and Kizuna.reconfigure() any number of times without
+    parsing the dictionary again.
     """
-    identity: Optional['IdentityConfig']
-    discovery: Optional['DiscoveryConfig']
-    security: Optional['SecurityConfig']
-    networking: Optional['NetworkConfig']
-    plugins: Optional[List['PluginConfig']]
+    
+    @staticmethod
+    def from_dict(config: Dict[str, Any]) -> KizunaConfig:
+        """
+        Parse and validate a configuration dictionary.
+        
+        Args:
+            config: Configuration dictionary.
+        
+        Returns:
+            The parsed KizunaConfig.
+        
+        Raises:
+            TypeError: If a section is not a dict or a value has the wrong type.
+                       The message names the key, e.g. "networking.listen_port".
+            ValueError: If a required key is missing or the settings are invalid.
+        
+        Example:
+            ```python
+            config = KizunaConfig.from_dict({"identity": {"device_name": "My Device"}})
+            kizuna = Kizuna(config)
+            ```
+        """
+        ...
+    
+    def __repr__(self) -> str: ...
 
 
 class IdentityConfig:
@@ -426,6 +830,7 @@ class NetworkConfig:
         enable_webrtc: Enable WebRTC transport (default: True).
         enable_websocket: Enable WebSocket transport (default: True).
         connection_timeout_secs: Connection timeout in seconds (default: 30).
+        pool_size_per_peer: Maximum pooled connections per peer (default: 8).
     """
     listen_port: Optional[int]
     enable_ipv6: bool
@@ -433,6 +838,7 @@ class NetworkConfig:
     enable_webrtc: bool
     enable_websocket: bool
     connection_timeout_secs: int
+    pool_size_per_peer: int
 
 
 class PluginConfig:
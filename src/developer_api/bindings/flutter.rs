@@ -253,6 +253,7 @@ pub mod frb_bindings {
                 enable_webrtc: self.enable_webrtc,
                 enable_websocket: self.enable_websocket,
                 connection_timeout_secs: 30,
+                ..NetworkConfig::default()
             };
             
             Ok(config)
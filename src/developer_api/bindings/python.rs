@@ -4,7 +4,7 @@
 #[cfg(feature = "python")]
 pub mod pyo3_bindings {
     use pyo3::prelude::*;
-    use pyo3::exceptions::{PyException, PyRuntimeError, PyValueError};
+    use pyo3::exceptions::{PyException, PyIndexError, PyRuntimeError, PyTypeError, PyValueError};
     use pyo3::types::{PyDict, PyList};
     use std::collections::HashMap;
     use std::path::PathBuf;
@@ -20,26 +20,30 @@ pub mod pyo3_bindings {
         KizunaEvent, PeerId, PeerInfo, TransferId, TransferInfo, TransferProgress, TransferResult, TransferDirection,
         StreamId, StreamInfo, StreamType, CommandResult as CoreCommandResult, ErrorEvent,
     };
-    use crate::developer_api::core::api::{KizunaInstance, StreamConfig};
+    use crate::developer_api::core::api::{KizunaInstance, StreamConfig, TransferHandle, TransferOptions};
+    use crate::developer_api::core::pool::{PooledConnection, DEFAULT_POOL_SIZE_PER_PEER};
+    use crate::file_transfer::{SendBackend, TransferCompletion};
     
     /// Python wrapper for KizunaInstance
     #[pyclass(name = "Kizuna")]
     pub struct PyKizuna {
         instance: Arc<Mutex<KizunaInstance>>,
         runtime: Arc<tokio::runtime::Runtime>,
+        events: Arc<Mutex<Option<EventSubscription>>>,
+        peers: Arc<std::sync::Mutex<Option<Py<PyPeerList>>>>,
     }
     
+    /// Event stream shared by successive `subscribe_events` calls
+    type EventSubscription = std::pin::Pin<Box<dyn futures::Stream<Item = KizunaEvent> + Send>>;
+    
     #[pymethods]
     impl PyKizuna {
         /// Initialize a new Kizuna instance
+        /// `config` is a KizunaConfig, a configuration dict, or None for defaults
         #[new]
         #[pyo3(signature = (config=None))]
-        fn new(config: Option<&PyDict>) -> PyResult<Self> {
-            let config = if let Some(config_dict) = config {
-                parse_config(config_dict)?
-            } else {
-                KizunaConfig::default()
-            };
+        fn new(config: Option<&PyAny>) -> PyResult<Self> {
+            let config = resolve_config(config)?;
             
             let runtime = tokio::runtime::Runtime::new()
                 .map_err(|e| PyRuntimeError::new_err(format!("Failed to create runtime: {}", e)))?;
@@ -51,28 +55,45 @@ pub mod pyo3_bindings {
             Ok(Self {
                 instance: Arc::new(Mutex::new(instance)),
                 runtime: Arc::new(runtime),
+                events: Arc::new(Mutex::new(None)),
+                peers: Arc::new(std::sync::Mutex::new(None)),
             })
         }
         
         /// Discover peers on the network
-        /// Returns a list of discovered peers
+        /// Returns a PeerList holding the discovered peers column by column;
+        /// it is also kept for `find_peer`
         fn discover_peers<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
             let instance = Arc::clone(&self.instance);
+            let last_peers = Arc::clone(&self.peers);
             
             pyo3_asyncio::tokio::future_into_py(py, async move {
                 let inst = instance.lock().await;
                 let mut stream = inst.discover_peers().await.map_err(to_py_err)?;
                 
-                let mut peers = Vec::new();
+                let mut peers = PyPeerList::default();
                 use futures::StreamExt;
                 while let Some(peer) = stream.next().await {
-                    peers.push(PyPeerInfo::from(peer));
+                    peers.push(peer);
                 }
                 
-                Ok(Python::with_gil(|py| peers.into_py(py)))
+                Python::with_gil(|py| {
+                    let peers = Py::new(py, peers)?;
+                    *last_peers.lock().unwrap() = Some(peers.clone_ref(py));
+                    Ok(peers.into_py(py))
+                })
             })
         }
         
+        /// Look up a peer by name in the latest discover_peers result
+        /// Uses the PeerList name index, returning None if no peer matches
+        #[pyo3(signature = (name))]
+        fn find_peer(&self, py: Python<'_>, name: &str) -> Option<PyPeerInfo> {
+            let peers = self.peers.lock().unwrap().as_ref()?.clone_ref(py);
+            let index = *peers.borrow(py).by_name.get(name)?;
+            Some(PyPeerInfo { peers, index })
+        }
+        
         /// Connect to a peer
         #[pyo3(signature = (peer_id))]
         fn connect_to_peer<'py>(&self, py: Python<'py>, peer_id: String) -> PyResult<&'py PyAny> {
@@ -87,20 +108,134 @@ pub mod pyo3_bindings {
             })
         }
         
+        /// Lease a pooled connection to a peer
+        /// Use as `async with kizuna.with_connection(peer_id) as conn:` and send
+        /// with `conn.transfer_file`; the connection is returned to the pool on
+        /// exit and reused by later leases
+        #[pyo3(signature = (peer_id))]
+        fn with_connection(&self, peer_id: String) -> PyPooledConnection {
+            PyPooledConnection {
+                peer_id,
+                instance: Arc::clone(&self.instance),
+                lease: Arc::new(Mutex::new(None)),
+            }
+        }
+        
+        /// Connect to several peers at once
+        /// All attempts run concurrently in one task; with `return_exceptions`
+        /// failed peers are reported as RuntimeError entries instead of raising
+        #[pyo3(signature = (peer_ids, return_exceptions=false))]
+        fn connect_to_peers<'py>(
+            &self,
+            py: Python<'py>,
+            peer_ids: Vec<String>,
+            return_exceptions: bool,
+        ) -> PyResult<&'py PyAny> {
+            let instance = Arc::clone(&self.instance);
+            
+            pyo3_asyncio::tokio::future_into_py(py, async move {
+                let inst = instance.lock().await;
+                let peer_ids = peer_ids.into_iter().map(PeerId::from).collect();
+                let results = inst.connect_to_peers(peer_ids).await.map_err(to_py_err)?;
+                
+                Python::with_gil(|py| {
+                    let mut connections = Vec::with_capacity(results.len());
+                    for result in results {
+                        match result {
+                            Ok(connection) => connections.push(
+                                PyPeerConnection { peer_id: connection.peer_id().0.clone() }.into_py(py),
+                            ),
+                            Err(e) if return_exceptions => connections.push(to_py_err(e).into_py(py)),
+                            Err(e) => return Err(to_py_err(e)),
+                        }
+                    }
+                    Ok(connections.into_py(py))
+                })
+            })
+        }
+        
         /// Transfer a file to a peer
-        #[pyo3(signature = (file_path, peer_id))]
-        fn transfer_file<'py>(&self, py: Python<'py>, file_path: String, peer_id: String) -> PyResult<&'py PyAny> {
+        /// Up to `queue_depth` chunks of `chunk_size` bytes are read ahead and
+        /// coalesced into a single write to the peer. `backend` selects
+        /// "auto", "pipeline", "sendfile" or "splice"; `zero_copy` lets "auto"
+        /// copy the file inside the kernel where the transport supports it. `force_async` keeps file
+        /// reads on a dedicated blocking thread. The file is sent unencrypted,
+        /// which must be allowed with `unencrypted` while encryption is enabled
+        #[pyo3(signature = (file_path, peer_id, queue_depth=64, chunk_size=262144, backend="auto".to_string(), zero_copy=false, pipe_size=None, force_async=false, unencrypted=false))]
+        fn transfer_file<'py>(
+            &self,
+            py: Python<'py>,
+            file_path: String,
+            peer_id: String,
+            queue_depth: usize,
+            chunk_size: usize,
+            backend: String,
+            zero_copy: bool,
+            pipe_size: Option<usize>,
+            force_async: bool,
+            unencrypted: bool,
+        ) -> PyResult<&'py PyAny> {
+            let options = transfer_options(queue_depth, chunk_size, &backend, zero_copy, pipe_size, force_async, unencrypted)?;
             let instance = Arc::clone(&self.instance);
             
             pyo3_asyncio::tokio::future_into_py(py, async move {
+                let transfer = instance.lock().await
+                    .prepare_transfer(PathBuf::from(file_path), options).await.map_err(to_py_err)?;
+                let lease = lease_connection(&instance, &PeerId::from(peer_id)).await?;
                 let inst = instance.lock().await;
-                let path = PathBuf::from(file_path);
-                let peer_id = PeerId::from(peer_id);
-                let handle = inst.transfer_file(path, peer_id).await.map_err(to_py_err)?;
+                let handle = inst.transfer_file_over(Arc::new(lease), transfer).await.map_err(to_py_err)?;
                 
-                Ok(Python::with_gil(|py| PyTransferHandle {
-                    transfer_id: handle.transfer_id().0.to_string(),
-                }.into_py(py)))
+                let handle = transfer_handle(&handle)?;
+                Ok(Python::with_gil(|py| handle.into_py(py)))
+            })
+        }
+        
+        /// Discover a peer by name, connect and start a transfer in one call
+        /// Replaces separate discover_peers/connect_to_peer/transfer_file
+        /// awaits; the pooled connection stays leased until the transfer is done.
+        /// Options are as for `transfer_file`
+        #[pyo3(signature = (name, file_path, queue_depth=64, chunk_size=262144, backend="auto".to_string(), zero_copy=false, pipe_size=None, force_async=false, unencrypted=false))]
+        fn transfer_file_to_name<'py>(
+            &self,
+            py: Python<'py>,
+            name: String,
+            file_path: String,
+            queue_depth: usize,
+            chunk_size: usize,
+            backend: String,
+            zero_copy: bool,
+            pipe_size: Option<usize>,
+            force_async: bool,
+            unencrypted: bool,
+        ) -> PyResult<&'py PyAny> {
+            let options = transfer_options(queue_depth, chunk_size, &backend, zero_copy, pipe_size, force_async, unencrypted)?;
+            let instance = Arc::clone(&self.instance);
+            
+            pyo3_asyncio::tokio::future_into_py(py, async move {
+                let (transfer, peer_id) = {
+                    let inst = instance.lock().await;
+                    let transfer = inst.prepare_transfer(PathBuf::from(file_path), options).await.map_err(to_py_err)?;
+                    (transfer, inst.find_peer_by_name(&name).await.map_err(to_py_err)?)
+                };
+                let lease = lease_connection(&instance, &peer_id).await?;
+                let inst = instance.lock().await;
+                let handle = inst.transfer_file_over(Arc::new(lease), transfer).await.map_err(to_py_err)?;
+                
+                let handle = transfer_handle(&handle)?;
+                Ok(Python::with_gil(|py| handle.into_py(py)))
+            })
+        }
+        
+        /// Stat a file without blocking the event loop
+        /// The lookup runs once on the runtime's blocking pool and returns the
+        /// file type, permissions and size together. Needs no instance, so
+        /// inputs can be checked before `Kizuna(...)` starts the core systems
+        #[staticmethod]
+        fn astat<'py>(py: Python<'py>, path: String) -> PyResult<&'py PyAny> {
+            pyo3_asyncio::tokio::future_into_py(py, async move {
+                let metadata = tokio::fs::metadata(&path).await?;
+                let stat = PyFileStat::from(metadata);
+                Ok(Python::with_gil(|py| stat.into_py(py)))
             })
         }
         
@@ -151,24 +286,61 @@ pub mod pyo3_bindings {
         }
         
         /// Subscribe to events
-        /// Returns an async iterator of events
-        fn subscribe_events<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
+        /// Waits for the next event, then returns it together with every event
+        /// already queued (up to `max_events`) so a burst resolves one awaitable
+        #[pyo3(signature = (max_events=256))]
+        fn subscribe_events<'py>(&self, py: Python<'py>, max_events: usize) -> PyResult<&'py PyAny> {
+            if max_events == 0 {
+                return Err(PyValueError::new_err("max_events must be positive"));
+            }
+            
             let instance = Arc::clone(&self.instance);
+            let subscription = Arc::clone(&self.events);
             
             pyo3_asyncio::tokio::future_into_py(py, async move {
-                let inst = instance.lock().await;
-                let mut stream = inst.subscribe_events().await.map_err(to_py_err)?;
+                use futures::{FutureExt, StreamExt};
+                
+                // Keep one subscription across calls so no events are lost between batches
+                let mut subscription = subscription.lock().await;
+                if subscription.is_none() {
+                    let inst = instance.lock().await;
+                    *subscription = Some(inst.subscribe_events().await.map_err(to_py_err)?);
+                }
+                let stream = subscription.as_mut().expect("subscription was just created");
                 
                 let mut events = Vec::new();
-                use futures::StreamExt;
-                while let Some(event) = stream.next().await {
+                if let Some(event) = stream.next().await {
                     events.push(PyKizunaEvent::from(event));
+                    while events.len() < max_events {
+                        match stream.next().now_or_never() {
+                            Some(Some(event)) => events.push(PyKizunaEvent::from(event)),
+                            _ => break,
+                        }
+                    }
                 }
                 
                 Ok(Python::with_gil(|py| events.into_py(py)))
             })
         }
         
+        /// Apply a new configuration to the running instance
+        /// Core systems are rebuilt while the runtime and event subscription are kept
+        #[pyo3(signature = (config=None))]
+        fn reconfigure<'py>(&self, py: Python<'py>, config: Option<&PyAny>) -> PyResult<&'py PyAny> {
+            let config = resolve_config(config)?;
+            
+            let instance = Arc::clone(&self.instance);
+            let peers = Arc::clone(&self.peers);
+            
+            pyo3_asyncio::tokio::future_into_py(py, async move {
+                let mut inst = instance.lock().await;
+                inst.update_config(config).await.map_err(to_py_err)?;
+                // Peers found under the old configuration may be gone
+                *peers.lock().unwrap() = None;
+                Ok(Python::with_gil(|py| py.None()))
+            })
+        }
+        
         /// Shutdown the Kizuna instance
         fn shutdown<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
             let instance = Arc::clone(&self.instance);
@@ -181,38 +353,195 @@ pub mod pyo3_bindings {
         }
     }
     
-    /// Python wrapper for PeerInfo
-    #[pyclass(name = "PeerInfo")]
-    #[derive(Clone)]
-    pub struct PyPeerInfo {
+    /// Discovered peers stored as parallel columns
+    /// Each column converts to a Python list in a single pass; indexing or
+    /// iterating yields lightweight PeerInfo views into the columns. Names are
+    /// indexed as peers are added, so lookups by name never loop in Python
+    #[pyclass(name = "PeerList")]
+    #[derive(Default)]
+    pub struct PyPeerList {
         #[pyo3(get)]
-        pub id: String,
+        pub ids: Vec<String>,
         #[pyo3(get)]
-        pub name: String,
+        pub names: Vec<String>,
+        /// Socket addresses as discovered, formatted only when displayed
+        pub socket_addresses: Vec<Vec<std::net::SocketAddr>>,
         #[pyo3(get)]
-        pub addresses: Vec<String>,
+        pub capabilities: Vec<Vec<String>>,
         #[pyo3(get)]
-        pub capabilities: Vec<String>,
-        #[pyo3(get)]
-        pub discovery_method: String,
+        pub discovery_methods: Vec<String>,
+        /// Row of the first peer with each name
+        by_name: HashMap<String, usize>,
+        /// Comma-joined addresses of each peer, built on first use
+        addresses_str: std::sync::OnceLock<Vec<String>>,
     }
     
-    impl From<PeerInfo> for PyPeerInfo {
-        fn from(info: PeerInfo) -> Self {
-            Self {
-                id: info.id.0,
-                name: info.name,
-                addresses: info.addresses,
-                capabilities: info.capabilities,
-                discovery_method: info.discovery_method,
+    impl PyPeerList {
+        fn push(&mut self, info: PeerInfo) {
+            self.by_name.entry(info.name.clone()).or_insert(self.ids.len());
+            self.ids.push(info.peer_id.0);
+            self.names.push(info.name);
+            self.socket_addresses.push(info.addresses);
+            self.capabilities.push(info.capabilities);
+            self.discovery_methods.push(info.discovery_method);
+        }
+        
+        /// Copy of the rows for which `keep` returns true
+        fn retain_rows(&self, keep: impl Fn(usize) -> bool) -> Self {
+            let mut kept = Self::default();
+            for index in (0..self.ids.len()).filter(|&index| keep(index)) {
+                kept.by_name.entry(self.names[index].clone()).or_insert(kept.ids.len());
+                kept.ids.push(self.ids[index].clone());
+                kept.names.push(self.names[index].clone());
+                kept.socket_addresses.push(self.socket_addresses[index].clone());
+                kept.capabilities.push(self.capabilities[index].clone());
+                kept.discovery_methods.push(self.discovery_methods[index].clone());
             }
+            kept
+        }
+        
+        /// Comma-joined addresses of every peer, formatted once per list
+        fn joined_addresses(&self) -> &[String] {
+            self.addresses_str.get_or_init(|| {
+                self.socket_addresses
+                    .iter()
+                    .map(|addresses| addresses.iter().map(|addr| addr.to_string()).collect::<Vec<_>>().join(", "))
+                    .collect()
+            })
         }
     }
     
     #[pymethods]
-    impl PyPeerInfo {
+    impl PyPeerList {
+        /// Network addresses of each peer as strings
+        #[getter]
+        fn addresses(&self) -> Vec<Vec<String>> {
+            self.socket_addresses
+                .iter()
+                .map(|addresses| addresses.iter().map(|addr| addr.to_string()).collect())
+                .collect()
+        }
+        
+        /// Comma-joined addresses of each peer, cached for display
+        #[getter]
+        fn addresses_str(&self) -> Vec<String> {
+            self.joined_addresses().to_vec()
+        }
+        
+        fn __len__(&self) -> usize {
+            self.ids.len()
+        }
+        
+        fn __getitem__(slf: PyRef<'_, Self>, index: isize) -> PyResult<PyPeerInfo> {
+            let len = slf.ids.len() as isize;
+            let index = if index < 0 { index + len } else { index };
+            if index < 0 || index >= len {
+                return Err(PyIndexError::new_err("peer index out of range"));
+            }
+            
+            Ok(PyPeerInfo { peers: slf.into(), index: index as usize })
+        }
+        
+        fn __iter__(slf: PyRef<'_, Self>) -> PyPeerListIter {
+            PyPeerListIter { peers: slf.into(), next: 0 }
+        }
+        
+        /// Look up the first peer with the given name
+        fn find(slf: PyRef<'_, Self>, name: &str) -> Option<PyPeerInfo> {
+            let index = *slf.by_name.get(name)?;
+            Some(PyPeerInfo { peers: slf.into(), index })
+        }
+        
+        /// Select the peers matching every given criterion
+        /// `ids` keeps only allowlisted peers, `discovery_method` and
+        /// `capability` match exactly; the selection runs without Python loops
+        #[pyo3(signature = (ids=None, discovery_method=None, capability=None))]
+        fn filter(
+            &self,
+            ids: Option<Vec<String>>,
+            discovery_method: Option<String>,
+            capability: Option<String>,
+        ) -> Self {
+            let ids: Option<std::collections::HashSet<String>> = ids.map(|ids| ids.into_iter().collect());
+            
+            self.retain_rows(|index| {
+                ids.as_ref().map_or(true, |ids| ids.contains(&self.ids[index]))
+                    && discovery_method.as_ref().map_or(true, |method| *method == self.discovery_methods[index])
+                    && capability.as_ref().map_or(true, |capability| self.capabilities[index].contains(capability))
+            })
+        }
+        
         fn __repr__(&self) -> String {
-            format!("PeerInfo(id='{}', name='{}')", self.id, self.name)
+            format!("PeerList(len={})", self.ids.len())
+        }
+    }
+    
+    /// Iterator over a PeerList
+    #[pyclass(name = "PeerListIterator")]
+    pub struct PyPeerListIter {
+        peers: Py<PyPeerList>,
+        next: usize,
+    }
+    
+    #[pymethods]
+    impl PyPeerListIter {
+        fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+            slf
+        }
+        
+        fn __next__(mut slf: PyRefMut<'_, Self>) -> Option<PyPeerInfo> {
+            let index = slf.next;
+            if index >= slf.peers.borrow(slf.py()).ids.len() {
+                return None;
+            }
+            
+            slf.next += 1;
+            Some(PyPeerInfo { peers: slf.peers.clone_ref(slf.py()), index })
+        }
+    }
+    
+    /// View of one peer in a PeerList
+    #[pyclass(name = "PeerInfo")]
+    pub struct PyPeerInfo {
+        peers: Py<PyPeerList>,
+        index: usize,
+    }
+    
+    #[pymethods]
+    impl PyPeerInfo {
+        #[getter]
+        fn id(&self, py: Python<'_>) -> String {
+            self.peers.borrow(py).ids[self.index].clone()
+        }
+        
+        #[getter]
+        fn name(&self, py: Python<'_>) -> String {
+            self.peers.borrow(py).names[self.index].clone()
+        }
+        
+        #[getter]
+        fn addresses(&self, py: Python<'_>) -> Vec<String> {
+            self.peers.borrow(py).socket_addresses[self.index].iter().map(|addr| addr.to_string()).collect()
+        }
+        
+        #[getter]
+        fn addresses_str(&self, py: Python<'_>) -> String {
+            self.peers.borrow(py).joined_addresses()[self.index].clone()
+        }
+        
+        #[getter]
+        fn capabilities(&self, py: Python<'_>) -> Vec<String> {
+            self.peers.borrow(py).capabilities[self.index].clone()
+        }
+        
+        #[getter]
+        fn discovery_method(&self, py: Python<'_>) -> String {
+            self.peers.borrow(py).discovery_methods[self.index].clone()
+        }
+        
+        fn __repr__(&self, py: Python<'_>) -> String {
+            let peers = self.peers.borrow(py);
+            format!("PeerInfo(id='{}', name='{}')", peers.ids[self.index], peers.names[self.index])
         }
     }
     
@@ -230,15 +559,121 @@ pub mod pyo3_bindings {
         }
     }
     
+    /// Python wrapper for a leased PooledConnection
+    /// Async context manager returned by `Kizuna.with_connection`; transfers
+    /// started from it run over the leased connection
+    #[pyclass(name = "PooledConnection")]
+    pub struct PyPooledConnection {
+        #[pyo3(get)]
+        pub peer_id: String,
+        instance: Arc<Mutex<KizunaInstance>>,
+        lease: Arc<Mutex<Option<Arc<PooledConnection>>>>,
+    }
+    
+    #[pymethods]
+    impl PyPooledConnection {
+        fn __aenter__<'py>(slf: PyRef<'py, Self>, py: Python<'py>) -> PyResult<&'py PyAny> {
+            let instance = Arc::clone(&slf.instance);
+            let lease = Arc::clone(&slf.lease);
+            let peer_id = PeerId::from(slf.peer_id.clone());
+            let this: Py<Self> = slf.into();
+            
+            pyo3_asyncio::tokio::future_into_py(py, async move {
+                let leased = lease_connection(&instance, &peer_id).await?;
+                *lease.lock().await = Some(Arc::new(leased));
+                
+                Ok(this)
+            })
+        }
+        
+        /// Transfer a file over the leased connection
+        /// Options are as for `Kizuna.transfer_file`. One transfer runs on the
+        /// connection at a time; the connection returns to the pool only once
+        /// the block has exited and the transfer is done
+        #[pyo3(signature = (file_path, queue_depth=64, chunk_size=262144, backend="auto".to_string(), zero_copy=false, pipe_size=None, force_async=false, unencrypted=false))]
+        fn transfer_file<'py>(
+            &self,
+            py: Python<'py>,
+            file_path: String,
+            queue_depth: usize,
+            chunk_size: usize,
+            backend: String,
+            zero_copy: bool,
+            pipe_size: Option<usize>,
+            force_async: bool,
+            unencrypted: bool,
+        ) -> PyResult<&'py PyAny> {
+            let options = transfer_options(queue_depth, chunk_size, &backend, zero_copy, pipe_size, force_async, unencrypted)?;
+            let instance = Arc::clone(&self.instance);
+            let lease = Arc::clone(&self.lease);
+            
+            pyo3_asyncio::tokio::future_into_py(py, async move {
+                let leased = lease.lock().await.clone()
+                    .ok_or_else(|| PyRuntimeError::new_err("Connection is not leased; use it in an `async with` block"))?;
+                let inst = instance.lock().await;
+                let transfer = inst.prepare_transfer(PathBuf::from(file_path), options).await.map_err(to_py_err)?;
+                let handle = inst.transfer_file_over(leased, transfer).await.map_err(to_py_err)?;
+                
+                let handle = transfer_handle(&handle)?;
+                Ok(Python::with_gil(|py| handle.into_py(py)))
+            })
+        }
+        
+        /// Return the connection to the pool, or drop it if the block raised
+        #[pyo3(signature = (exc_type=None, _exc_value=None, _traceback=None))]
+        fn __aexit__<'py>(
+            &self,
+            py: Python<'py>,
+            exc_type: Option<PyObject>,
+            _exc_value: Option<PyObject>,
+            _traceback: Option<PyObject>,
+        ) -> PyResult<&'py PyAny> {
+            let lease = Arc::clone(&self.lease);
+            let failed = exc_type.map_or(false, |exc_type| !exc_type.is_none(py));
+            
+            pyo3_asyncio::tokio::future_into_py(py, async move {
+                if let Some(leased) = lease.lock().await.take() {
+                    // Transfers still running keep their share of the lease
+                    if failed {
+                        leased.poison();
+                    }
+                }
+                Ok(Python::with_gil(|py| false.into_py(py)))
+            })
+        }
+        
+        fn __repr__(&self) -> String {
+            format!("PooledConnection(peer_id='{}')", self.peer_id)
+        }
+    }
+    
     /// Python wrapper for TransferHandle
     #[pyclass(name = "TransferHandle")]
     pub struct PyTransferHandle {
         #[pyo3(get)]
         pub transfer_id: String,
+        completion: TransferCompletion,
     }
     
     #[pymethods]
     impl PyTransferHandle {
+        /// Wait for the transfer to finish
+        /// Resolves with the number of bytes sent once the last chunk is flushed
+        fn done<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
+            let mut completion = self.completion.clone();
+            
+            pyo3_asyncio::tokio::future_into_py(py, async move {
+                let bytes_sent = completion.wait().await
+                    .map_err(|e| PyRuntimeError::new_err(format!("File transfer failed: {}", e)))?;
+                Ok(Python::with_gil(|py| bytes_sent.into_py(py)))
+            })
+        }
+        
+        /// Whether the transfer has finished
+        fn is_done(&self) -> bool {
+            self.completion.is_done()
+        }
+        
         fn __repr__(&self) -> String {
             format!("TransferHandle(transfer_id='{}')", self.transfer_id)
         }
@@ -372,124 +807,221 @@ pub mod pyo3_bindings {
         }
     }
     
+    /// Python wrapper for file metadata returned by `astat`
+    #[pyclass(name = "FileStat")]
+    pub struct PyFileStat {
+        #[pyo3(get)]
+        pub mode: u32,
+        #[pyo3(get)]
+        pub size: u64,
+    }
+    
+    impl From<std::fs::Metadata> for PyFileStat {
+        fn from(metadata: std::fs::Metadata) -> Self {
+            #[cfg(unix)]
+            let mode = {
+                use std::os::unix::fs::MetadataExt;
+                metadata.mode()
+            };
+            
+            // Synthesize POSIX type and permission bits elsewhere
+            #[cfg(not(unix))]
+            let mode = {
+                let file_type = if metadata.is_dir() { 0o040000 } else if metadata.is_file() { 0o100000 } else { 0 };
+                let permissions = if metadata.permissions().readonly() { 0o444 } else { 0o644 };
+                file_type | permissions
+            };
+            
+            Self {
+                mode,
+                size: metadata.len(),
+            }
+        }
+    }
+    
+    #[pymethods]
+    impl PyFileStat {
+        fn __repr__(&self) -> String {
+            format!("FileStat(mode={:o}, size={})", self.mode, self.size)
+        }
+    }
+    
+    /// Parsed and validated Kizuna configuration
+    /// Built once with `KizunaConfig.from_dict` and reusable across `Kizuna`
+    /// instances and `reconfigure` calls without walking the dict again
+    #[pyclass(name = "KizunaConfig")]
+    #[derive(Clone)]
+    pub struct PyKizunaConfig {
+        config: KizunaConfig,
+    }
+    
+    #[pymethods]
+    impl PyKizunaConfig {
+        /// Parse and validate a configuration dict
+        /// Raises TypeError naming the offending key for wrongly typed values
+        /// and ValueError for invalid settings
+        #[staticmethod]
+        fn from_dict(config: &PyDict) -> PyResult<Self> {
+            let config = parse_config(config)?;
+            config.validate().map_err(PyValueError::new_err)?;
+            Ok(Self { config })
+        }
+        
+        fn __repr__(&self) -> String {
+            let device_name = self.config.identity.as_ref().map(|identity| identity.device_name.as_str());
+            format!("KizunaConfig(device_name={:?})", device_name)
+        }
+    }
+    
+    /// Helper function to resolve the `config` argument of `Kizuna` methods
+    /// Accepts None for defaults, a KizunaConfig, or a plain dict
+    fn resolve_config(config: Option<&PyAny>) -> PyResult<KizunaConfig> {
+        let config = match config {
+            Some(config) => config,
+            None => return Ok(KizunaConfig::default()),
+        };
+        
+        if let Ok(parsed) = config.extract::<PyRef<PyKizunaConfig>>() {
+            return Ok(parsed.config.clone());
+        }
+        
+        match config.downcast::<PyDict>() {
+            Ok(config_dict) => parse_config(config_dict),
+            Err(_) => Err(PyTypeError::new_err("config must be a KizunaConfig or a dict")),
+        }
+    }
+    
+    /// Helper function to look up a nested section of the config dict
+    fn config_section<'py>(config_dict: &'py PyDict, section: &str) -> PyResult<Option<&'py PyDict>> {
+        config_dict.get_item(section)?
+            .map(|value| value.downcast::<PyDict>()
+                .map_err(|_| PyTypeError::new_err(format!("{} must be a dict", section))))
+            .transpose()
+    }
+    
+    /// Helper function to extract one typed field of a config section
+    /// Conversion errors name the key as `section.key`
+    fn config_field<'py, T: FromPyObject<'py>>(section_dict: &'py PyDict, section: &str, key: &str) -> PyResult<Option<T>> {
+        section_dict.get_item(key)?
+            .map(|value| value.extract::<T>()
+                .map_err(|e| PyTypeError::new_err(format!("{}.{}: {}", section, key, e))))
+            .transpose()
+    }
+    
     /// Helper function to parse Python dict into KizunaConfig
     fn parse_config(config_dict: &PyDict) -> PyResult<KizunaConfig> {
         let mut config = KizunaConfig::default();
         
         // Parse identity config
-        if let Some(identity) = config_dict.get_item("identity")? {
-            let identity_dict = identity.downcast::<PyDict>()?;
-            let device_name = identity_dict.get_item("device_name")?
-                .ok_or_else(|| PyValueError::new_err("device_name is required"))?
-                .extract::<String>()?;
-            
-            let user_name = identity_dict.get_item("user_name")?
-                .map(|v| v.extract::<String>())
-                .transpose()?;
-            
-            let identity_path = identity_dict.get_item("identity_path")?
-                .map(|v| v.extract::<String>().map(PathBuf::from))
-                .transpose()?;
+        if let Some(identity_dict) = config_section(config_dict, "identity")? {
+            let device_name = config_field::<String>(identity_dict, "identity", "device_name")?
+                .ok_or_else(|| PyValueError::new_err("identity.device_name is required"))?;
             
             config.identity = Some(IdentityConfig {
                 device_name,
-                user_name,
-                identity_path,
+                user_name: config_field(identity_dict, "identity", "user_name")?,
+                identity_path: config_field::<String>(identity_dict, "identity", "identity_path")?
+                    .map(PathBuf::from),
             });
         }
         
         // Parse discovery config
-        if let Some(discovery) = config_dict.get_item("discovery")? {
-            let discovery_dict = discovery.downcast::<PyDict>()?;
+        if let Some(discovery_dict) = config_section(config_dict, "discovery")? {
             config.discovery = DiscoveryConfig {
-                enable_mdns: discovery_dict.get_item("enable_mdns")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(true),
-                enable_udp: discovery_dict.get_item("enable_udp")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(true),
-                enable_bluetooth: discovery_dict.get_item("enable_bluetooth")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(false),
-                interval_secs: discovery_dict.get_item("interval_secs")?
-                    .map(|v| v.extract::<u64>())
-                    .transpose()?
-                    .unwrap_or(5),
-                timeout_secs: discovery_dict.get_item("timeout_secs")?
-                    .map(|v| v.extract::<u64>())
-                    .transpose()?
-                    .unwrap_or(30),
+                enable_mdns: config_field(discovery_dict, "discovery", "enable_mdns")?.unwrap_or(true),
+                enable_udp: config_field(discovery_dict, "discovery", "enable_udp")?.unwrap_or(true),
+                enable_bluetooth: config_field(discovery_dict, "discovery", "enable_bluetooth")?.unwrap_or(false),
+                interval_secs: config_field(discovery_dict, "discovery", "interval_secs")?.unwrap_or(5),
+                timeout_secs: config_field(discovery_dict, "discovery", "timeout_secs")?.unwrap_or(30),
             };
         }
         
         // Parse security config
-        if let Some(security) = config_dict.get_item("security")? {
-            let security_dict = security.downcast::<PyDict>()?;
-            let trust_mode = security_dict.get_item("trust_mode")?
-                .map(|v| {
-                    let mode_str = v.extract::<String>()?;
-                    match mode_str.as_str() {
-                        "trust_all" => Ok(TrustMode::TrustAll),
-                        "manual" => Ok(TrustMode::Manual),
-                        "allowlist_only" => Ok(TrustMode::AllowlistOnly),
-                        _ => Err(PyValueError::new_err("Invalid trust mode")),
-                    }
+        if let Some(security_dict) = config_section(config_dict, "security")? {
+            let trust_mode = config_field::<String>(security_dict, "security", "trust_mode")?
+                .map(|mode_str| match mode_str.as_str() {
+                    "trust_all" => Ok(TrustMode::TrustAll),
+                    "manual" => Ok(TrustMode::Manual),
+                    "allowlist_only" => Ok(TrustMode::AllowlistOnly),
+                    _ => Err(PyValueError::new_err(format!("security.trust_mode: invalid trust mode '{}'", mode_str))),
                 })
                 .transpose()?
                 .unwrap_or(TrustMode::Manual);
             
             config.security = SecurityConfig {
-                enable_encryption: security_dict.get_item("enable_encryption")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(true),
-                require_authentication: security_dict.get_item("require_authentication")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(true),
+                enable_encryption: config_field(security_dict, "security", "enable_encryption")?.unwrap_or(true),
+                require_authentication: config_field(security_dict, "security", "require_authentication")?.unwrap_or(true),
                 trust_mode,
-                key_storage_path: security_dict.get_item("key_storage_path")?
-                    .map(|v| v.extract::<String>().map(PathBuf::from))
-                    .transpose()?,
+                key_storage_path: config_field::<String>(security_dict, "security", "key_storage_path")?
+                    .map(PathBuf::from),
             };
         }
         
         // Parse networking config
-        if let Some(networking) = config_dict.get_item("networking")? {
-            let networking_dict = networking.downcast::<PyDict>()?;
+        if let Some(networking_dict) = config_section(config_dict, "networking")? {
             config.networking = NetworkConfig {
-                listen_port: networking_dict.get_item("listen_port")?
-                    .map(|v| v.extract::<u16>())
-                    .transpose()?,
-                enable_ipv6: networking_dict.get_item("enable_ipv6")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(true),
-                enable_quic: networking_dict.get_item("enable_quic")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(true),
-                enable_webrtc: networking_dict.get_item("enable_webrtc")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(true),
-                enable_websocket: networking_dict.get_item("enable_websocket")?
-                    .map(|v| v.extract::<bool>())
-                    .transpose()?
-                    .unwrap_or(true),
-                connection_timeout_secs: networking_dict.get_item("connection_timeout_secs")?
-                    .map(|v| v.extract::<u64>())
-                    .transpose()?
-                    .unwrap_or(30),
+                listen_port: config_field(networking_dict, "networking", "listen_port")?,
+                enable_ipv6: config_field(networking_dict, "networking", "enable_ipv6")?.unwrap_or(true),
+                enable_quic: config_field(networking_dict, "networking", "enable_quic")?.unwrap_or(true),
+                enable_webrtc: config_field(networking_dict, "networking", "enable_webrtc")?.unwrap_or(true),
+                enable_websocket: config_field(networking_dict, "networking", "enable_websocket")?.unwrap_or(true),
+                connection_timeout_secs: config_field(networking_dict, "networking", "connection_timeout_secs")?.unwrap_or(30),
+                pool_size_per_peer: config_field(networking_dict, "networking", "pool_size_per_peer")?
+                    .unwrap_or(DEFAULT_POOL_SIZE_PER_PEER),
             };
         }
         
         Ok(config)
     }
     
+    /// Helper function to validate transfer keyword arguments
+    fn transfer_options(
+        queue_depth: usize,
+        chunk_size: usize,
+        backend: &str,
+        zero_copy: bool,
+        pipe_size: Option<usize>,
+        force_async: bool,
+        unencrypted: bool,
+    ) -> PyResult<TransferOptions> {
+        if queue_depth == 0 || chunk_size == 0 {
+            return Err(PyValueError::new_err("queue_depth and chunk_size must be positive"));
+        }
+        if pipe_size == Some(0) {
+            return Err(PyValueError::new_err("pipe_size must be positive"));
+        }
+        
+        let backend = match backend {
+            "auto" => SendBackend::Auto,
+            "pipeline" => SendBackend::Pipeline,
+            "sendfile" => SendBackend::Sendfile,
+            "splice" => SendBackend::Splice,
+            other => return Err(PyValueError::new_err(format!("Unknown transfer backend: {}", other))),
+        };
+        
+        Ok(TransferOptions { queue_depth, chunk_size, backend, zero_copy, pipe_size, force_async, unencrypted })
+    }
+    
+    /// Helper function to lease a pooled connection to a peer
+    /// Waits for a free slot without holding the instance, so a lease holder
+    /// can still use the instance meanwhile
+    async fn lease_connection(instance: &Mutex<KizunaInstance>, peer_id: &PeerId) -> PyResult<PooledConnection> {
+        let (pool, transport_arc, peer_address) = {
+            let inst = instance.lock().await;
+            let (pool, transport_arc) = inst.connection_pool().await.map_err(to_py_err)?;
+            (pool, transport_arc, inst.peer_address(peer_id).await)
+        };
+        let transport = transport_arc.read().await;
+        pool.lease_from(&transport, &peer_address).await.map_err(to_py_err)
+    }
+    
+    /// Helper function to wrap the handle of a pipeline transfer
+    fn transfer_handle(handle: &TransferHandle) -> PyResult<PyTransferHandle> {
+        let completion = handle.completion().cloned()
+            .ok_or_else(|| PyRuntimeError::new_err("Transfer has no completion signal"))?;
+        Ok(PyTransferHandle { transfer_id: handle.transfer_id().0.to_string(), completion })
+    }
+    
     /// Helper function to convert KizunaError to PyErr
     fn to_py_err(error: KizunaError) -> PyErr {
         PyRuntimeError::new_err(error.to_string())
@@ -499,13 +1031,18 @@ pub mod pyo3_bindings {
     #[pymodule]
     fn kizuna(_py: Python, m: &PyModule) -> PyResult<()> {
         m.add_class::<PyKizuna>()?;
+        m.add_class::<PyKizunaConfig>()?;
+        m.add_class::<PyPeerList>()?;
+        m.add_class::<PyPeerListIter>()?;
         m.add_class::<PyPeerInfo>()?;
         m.add_class::<PyPeerConnection>()?;
+        m.add_class::<PyPooledConnection>()?;
         m.add_class::<PyTransferHandle>()?;
         m.add_class::<PyStreamHandle>()?;
         m.add_class::<PyCommandResult>()?;
         m.add_class::<PyKizunaEvent>()?;
         m.add_class::<PyTransferProgress>()?;
+        m.add_class::<PyFileStat>()?;
         Ok(())
     }
 }
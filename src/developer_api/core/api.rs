@@ -68,6 +68,12 @@ pub struct KizunaInstance {
     shutdown_tx: Arc<tokio::sync::broadcast::Sender<()>>,
     // Resource cleanup tasks
     cleanup_tasks: super::runtime::ThreadSafe<Vec<tokio::task::JoinHandle<()>>>,
+    // Chunk buffers reused by every transfer started from this instance
+    buffer_pool: crate::file_transfer::BufferPool,
+    // Transport connections leased per peer by `lease_connection`
+    connection_pool: super::pool::ConnectionPool,
+    // Transport addresses of discovered peers, built once per discovery
+    peer_addresses: Arc<RwLock<std::collections::HashMap<PeerId, crate::transport::PeerAddress>>>,
 }
 
 impl KizunaInstance {
@@ -97,6 +103,7 @@ impl KizunaInstance {
         
         // Create integrated system manager
         let system_manager = Arc::new(IntegratedSystemManager::new(config.clone()));
+        let connection_pool = super::pool::ConnectionPool::new(config.networking.pool_size_per_peer);
         
         Ok(Self {
             config,
@@ -107,6 +114,9 @@ impl KizunaInstance {
             state: Arc::new(tokio::sync::RwLock::new(InstanceState::Initializing)),
             shutdown_tx,
             cleanup_tasks: super::runtime::ThreadSafe::new(Vec::new()),
+            buffer_pool: crate::file_transfer::BufferPool::default(),
+            connection_pool,
+            peer_addresses: Arc::new(RwLock::new(std::collections::HashMap::new())),
         })
     }
     
@@ -148,7 +158,12 @@ impl KizunaInstance {
     }
     
     /// Updates the configuration with validation
-    pub async fn update_config(&self, new_config: KizunaConfig) -> Result<(), KizunaError> {
+    ///
+    /// The core systems are rebuilt from the new configuration while the
+    /// runtime, event subscribers and transfer buffer pool are kept, so an
+    /// instance can be reused across configurations. Runtime settings such as
+    /// `runtime_threads` keep their original values.
+    pub async fn update_config(&mut self, new_config: KizunaConfig) -> Result<(), KizunaError> {
         // Validate new configuration
         new_config.validate()
             .map_err(|e| KizunaError::config(e))?;
@@ -159,9 +174,28 @@ impl KizunaInstance {
             return Err(KizunaError::state("Cannot update config during shutdown"));
         }
         
-        // Note: In a real implementation, we would need to handle config updates
-        // by potentially reinitializing affected systems
-        Err(KizunaError::other("Configuration updates not yet implemented"))
+        // Bring up systems built from the new configuration before touching
+        // the running ones, so a failure leaves the instance as it was
+        let system_manager = Arc::new(IntegratedSystemManager::new(new_config.clone()));
+        if current_state == InstanceState::Ready {
+            if let Err(e) = system_manager.initialize().await {
+                let _ = system_manager.shutdown().await;
+                return Err(e);
+            }
+        }
+        
+        // Pooled connections and peer addresses belong to the old systems
+        self.connection_pool.clear();
+        self.connection_pool = super::pool::ConnectionPool::new(new_config.networking.pool_size_per_peer);
+        self.peer_addresses.write().await.clear();
+        let old_manager = std::mem::replace(&mut self.system_manager, system_manager);
+        self.config = new_config;
+        
+        if current_state == InstanceState::Ready {
+            old_manager.shutdown().await?;
+        }
+        
+        Ok(())
     }
     
     /// Gets the async runtime
@@ -246,6 +280,241 @@ impl KizunaInstance {
         tasks.push(handle);
     }
     
+    /// Streams a file's raw bytes to a peer through the send pipeline
+    ///
+    /// Unlike `KizunaAPI::transfer_file`, which runs a file transfer session,
+    /// no manifest is exchanged and the bytes are neither framed nor
+    /// encrypted. The file is sent over a connection leased from the pool,
+    /// which is held until the transfer finishes. Unless encryption is
+    /// disabled in the security configuration, the caller has to opt in with
+    /// `TransferOptions::unencrypted`.
+    pub async fn transfer_file_with_options(
+        &self,
+        file: PathBuf,
+        peer_id: PeerId,
+        options: TransferOptions,
+    ) -> Result<TransferHandle, KizunaError> {
+        // Refuse before paying for a connection
+        let transfer = self.prepare_transfer(file, options).await?;
+        
+        let lease = self.lease_connection(peer_id).await?;
+        self.transfer_file_over(Arc::new(lease), transfer).await
+    }
+    
+    /// Starts a prepared transfer over an already leased pooled connection
+    ///
+    /// The transfer keeps its own reference to the lease, so the connection
+    /// goes back to the pool only once both the caller and the transfer are
+    /// done with it. A connection whose transfer failed is not reused.
+    pub async fn transfer_file_over(
+        &self,
+        lease: Arc<super::pool::PooledConnection>,
+        transfer: PreparedTransfer,
+    ) -> Result<TransferHandle, KizunaError> {
+        let PreparedTransfer { file, options } = transfer;
+        
+        // Get file transfer system from integrated manager
+        let ft_arc = self.system_manager.file_transfer().await?;
+        let ft = ft_arc.as_ref();
+        
+        let pipeline_config = crate::file_transfer::PipelineConfig {
+            queue_depth: options.queue_depth,
+            chunk_size: options.chunk_size,
+            backend: options.backend,
+            zero_copy: options.zero_copy,
+            pipe_size: options.pipe_size,
+            buffer_pool: Some(self.buffer_pool.clone()),
+            force_async: options.force_async,
+        };
+        
+        // Start file transfer, one at a time per connection
+        lease.begin_transfer()?;
+        let connection = lease.connection().shared_connection();
+        let (session, completion) = match ft.send_file_unencrypted(file, lease.peer_id().to_string(), connection, pipeline_config).await {
+            Ok(started) => started,
+            Err(e) => {
+                lease.end_transfer();
+                return Err(KizunaError::file_transfer(format!("File transfer failed: {}", e)));
+            }
+        };
+        
+        let mut finished = completion.clone();
+        self.runtime.spawn(async move {
+            // A failed send may leave part of the file on the connection
+            if finished.wait().await.is_err() {
+                lease.poison();
+            }
+            lease.end_transfer();
+        });
+        
+        Ok(TransferHandle { 
+            transfer_id: TransferId::from_uuid(session.session_id),
+            completion: Some(completion),
+        })
+    }
+    
+    /// Checks that a pipeline transfer of `file` with `options` may start
+    ///
+    /// Run this before leasing a connection, so a transfer that cannot start
+    /// never opens one. The result is what `transfer_file_over` accepts.
+    pub async fn prepare_transfer(&self, file: PathBuf, options: TransferOptions) -> Result<PreparedTransfer, KizunaError> {
+        // Check state
+        let current_state = *self.state.read().await;
+        if current_state != InstanceState::Ready {
+            return Err(KizunaError::state(format!("Cannot transfer file: instance is in {:?} state", current_state)));
+        }
+        
+        // The send pipeline does not encrypt, so plaintext must be asked for
+        if self.config.security.enable_encryption && !options.unencrypted {
+            return Err(KizunaError::file_transfer(
+                "Transfers are sent unencrypted; set `unencrypted` or disable encryption to send anyway",
+            ));
+        }
+        
+        // Validate file exists without blocking the runtime
+        match tokio::fs::metadata(&file).await {
+            Ok(metadata) if metadata.is_file() => {}
+            _ => return Err(KizunaError::other(format!("File not found: {:?}", file))),
+        }
+        
+        Ok(PreparedTransfer { file, options })
+    }
+    
+    /// Discovers the peer called `name`, connects and starts a transfer to it
+    ///
+    /// The whole discover → connect → transfer chain runs as one call. The
+    /// pooled connection to the peer stays leased until the transfer
+    /// finishes and is then returned to the pool.
+    pub async fn transfer_file_to_name(
+        &self,
+        name: &str,
+        file: PathBuf,
+        options: TransferOptions,
+    ) -> Result<TransferHandle, KizunaError> {
+        let transfer = self.prepare_transfer(file, options).await?;
+        let peer_id = self.find_peer_by_name(name).await?;
+        
+        let lease = self.lease_connection(peer_id).await?;
+        self.transfer_file_over(Arc::new(lease), transfer).await
+    }
+    
+    /// Discovers peers and returns the ID of the one called `name`
+    ///
+    /// Discovery also records the peer's transport address, so a lease taken
+    /// afterwards connects without resolving it again.
+    pub async fn find_peer_by_name(&self, name: &str) -> Result<PeerId, KizunaError> {
+        use futures::StreamExt;
+        
+        let mut peers = self.discover_peers().await?;
+        while let Some(peer) = peers.next().await {
+            if peer.name == name {
+                return Ok(peer.peer_id);
+            }
+        }
+        
+        Err(KizunaError::not_found(format!("peer '{}'", name)))
+    }
+    
+    /// Connects to several peers at once
+    ///
+    /// The transport is looked up once and every connection attempt runs
+    /// concurrently within a single future. Results are returned in the order
+    /// of `peer_ids`, so one failed peer does not abort the others.
+    pub async fn connect_to_peers(
+        &self,
+        peer_ids: Vec<PeerId>,
+    ) -> Result<Vec<Result<PeerConnection, KizunaError>>, KizunaError> {
+        // Check state
+        let current_state = *self.state.read().await;
+        if current_state != InstanceState::Ready {
+            return Err(KizunaError::state(format!("Cannot connect to peers: instance is in {:?} state", current_state)));
+        }
+        
+        // Get transport system from integrated manager
+        let transport_arc = self.system_manager.transport().await?;
+        let transport = transport_arc.read().await;
+        
+        let mut peer_addresses = Vec::with_capacity(peer_ids.len());
+        for peer_id in peer_ids {
+            peer_addresses.push(self.peer_address(&peer_id).await);
+        }
+        
+        let attempts = peer_addresses
+            .iter()
+            .map(|peer_address| Self::connect_with_transport(&transport, peer_address));
+        
+        Ok(futures::future::join_all(attempts).await)
+    }
+    
+    /// Leases a pooled connection to a peer
+    ///
+    /// Idle connections from earlier leases are reused while they are still
+    /// connected; a new one is opened only when none is available. Up to
+    /// `networking.pool_size_per_peer` leases per peer may be held at once,
+    /// further calls wait for one to be released. Dropping the lease returns
+    /// the connection to the pool.
+    pub async fn lease_connection(&self, peer_id: PeerId) -> Result<super::pool::PooledConnection, KizunaError> {
+        let (pool, transport_arc) = self.connection_pool().await?;
+        let peer_address = self.peer_address(&peer_id).await;
+        let transport = transport_arc.read().await;
+        
+        pool.lease_from(&transport, &peer_address).await
+    }
+    
+    /// Gets the connection pool together with the transport it connects through
+    ///
+    /// Both are shared handles, so a caller can wait for a free slot without
+    /// keeping the instance borrowed.
+    pub async fn connection_pool(
+        &self,
+    ) -> Result<(super::pool::ConnectionPool, Arc<RwLock<crate::transport::api::KizunaTransport>>), KizunaError> {
+        // Check state
+        let current_state = *self.state.read().await;
+        if current_state != InstanceState::Ready {
+            return Err(KizunaError::state(format!("Cannot lease connection: instance is in {:?} state", current_state)));
+        }
+        
+        // Get transport system from integrated manager
+        let transport = self.system_manager.transport().await?;
+        
+        Ok((self.connection_pool.clone(), transport))
+    }
+    
+    /// Connects to a single peer through an already resolved transport
+    async fn connect_with_transport(
+        transport: &crate::transport::api::KizunaTransport,
+        peer_address: &crate::transport::PeerAddress,
+    ) -> Result<PeerConnection, KizunaError> {
+        // Connect to peer
+        let _connection = transport.connect_to_peer(peer_address).await
+            .map_err(|e| KizunaError::transport(format!("Connection failed: {}", e)))?;
+        
+        Ok(PeerConnection { peer_id: PeerId::from(peer_address.peer_id.clone()) })
+    }
+    
+    /// Transport address for a peer
+    ///
+    /// Peers seen by `discover_peers` reuse the socket addresses recorded at
+    /// discovery, so connecting never re-parses or re-resolves them. Unknown
+    /// peers get an address without socket addresses.
+    pub async fn peer_address(&self, peer_id: &PeerId) -> crate::transport::PeerAddress {
+        if let Some(peer_address) = self.peer_addresses.read().await.get(peer_id) {
+            return peer_address.clone();
+        }
+        
+        Self::transport_address(peer_id, Vec::new())
+    }
+    
+    /// Builds the transport address for a peer from its socket addresses
+    fn transport_address(peer_id: &PeerId, addresses: Vec<std::net::SocketAddr>) -> crate::transport::PeerAddress {
+        crate::transport::PeerAddress::new(
+            peer_id.to_string(),
+            addresses,
+            vec!["tcp".to_string()],
+            crate::transport::TransportCapabilities::tcp(),
+        )
+    }
+    
     /// Subscribes to shutdown signals
     pub fn subscribe_shutdown(&self) -> tokio::sync::broadcast::Receiver<()> {
         self.shutdown_tx.subscribe()
@@ -282,7 +551,8 @@ impl KizunaInstance {
         // Signal shutdown to runtime
         self.runtime.signal_shutdown().await;
         
-        // Shutdown all integrated systems
+        // Release idle pooled connections and shutdown all integrated systems
+        self.connection_pool.clear();
         let _ = self.system_manager.shutdown().await;
         
         // Wait for cleanup tasks to complete with timeout
@@ -327,12 +597,29 @@ impl KizunaAPI for KizunaInstance {
         
         // Convert to stream
         use futures::stream;
-        let peer_infos: Vec<PeerInfo> = peers.into_iter().map(|sr| PeerInfo {
-            peer_id: sr.peer_id.into(),
-            name: sr.name,
-            addresses: sr.addresses,
+        let peer_infos: Vec<PeerInfo> = peers.into_iter().map(|sr| {
+            let mut capabilities: Vec<String> = sr.capabilities.into_keys().collect();
+            capabilities.sort();
+            PeerInfo {
+                peer_id: sr.peer_id.into(),
+                name: sr.name,
+                addresses: sr.addresses,
+                capabilities,
+                discovery_method: sr.discovery_method,
+            }
         }).collect();
         
+        // Remember each peer's transport address for later connections
+        {
+            let mut peer_addresses = self.peer_addresses.write().await;
+            for info in &peer_infos {
+                peer_addresses.insert(
+                    info.peer_id.clone(),
+                    Self::transport_address(&info.peer_id, info.addresses.clone()),
+                );
+            }
+        }
+        
         let stream = stream::iter(peer_infos);
         Ok(Box::pin(stream))
     }
@@ -348,19 +635,7 @@ impl KizunaAPI for KizunaInstance {
         let transport_arc = self.system_manager.transport().await?;
         let transport = transport_arc.read().await;
         
-        // Create peer address (simplified - in production would need full address info)
-        let peer_address = crate::transport::PeerAddress::new(
-            peer_id.to_string(),
-            vec![],
-            vec!["tcp".to_string()],
-            crate::transport::TransportCapabilities::tcp(),
-        );
-        
-        // Connect to peer
-        let _connection = transport.connect_to_peer(&peer_address).await
-            .map_err(|e| KizunaError::transport(format!("Connection failed: {}", e)))?;
-        
-        Ok(PeerConnection { peer_id })
+        Self::connect_with_transport(&transport, &self.peer_address(&peer_id).await).await
     }
     
     async fn transfer_file(&self, file: PathBuf, peer_id: PeerId) -> Result<TransferHandle, KizunaError> {
@@ -384,7 +659,8 @@ impl KizunaAPI for KizunaInstance {
             .map_err(|e| KizunaError::file_transfer(format!("File transfer failed: {}", e)))?;
         
         Ok(TransferHandle { 
-            transfer_id: TransferId::from_uuid(session.session_id)
+            transfer_id: TransferId::from_uuid(session.session_id),
+            completion: None,
         })
     }
     
@@ -466,9 +742,18 @@ impl PeerConnection {
     }
 }
 
+/// Pipeline transfer that passed `KizunaInstance::prepare_transfer`
+#[derive(Debug, Clone)]
+pub struct PreparedTransfer {
+    file: PathBuf,
+    options: TransferOptions,
+}
+
 /// Handle to a file transfer operation
 pub struct TransferHandle {
     transfer_id: TransferId,
+    /// Set for pipeline transfers, which finish in the background
+    completion: Option<crate::file_transfer::TransferCompletion>,
 }
 
 impl TransferHandle {
@@ -477,6 +762,22 @@ impl TransferHandle {
         &self.transfer_id
     }
     
+    /// Gets the signal that resolves when a pipeline transfer finishes
+    ///
+    /// Session transfers started by `KizunaAPI::transfer_file` have none and
+    /// are followed through their file transfer session instead.
+    pub fn completion(&self) -> Option<&crate::file_transfer::TransferCompletion> {
+        self.completion.as_ref()
+    }
+    
+    /// Waits for a pipeline transfer to finish, returning the number of bytes sent
+    pub async fn done(&self) -> Result<u64, KizunaError> {
+        let mut completion = self.completion.clone()
+            .ok_or_else(|| KizunaError::state("Session transfers have no completion signal"))?;
+        completion.wait().await
+            .map_err(|e| KizunaError::file_transfer(format!("File transfer failed: {}", e)))
+    }
+    
     /// Cancels the transfer
     pub async fn cancel(&self) -> Result<(), KizunaError> {
         // Cancel the file transfer
@@ -504,6 +805,46 @@ impl StreamHandle {
     }
 }
 
+/// Options controlling how a file is streamed to a peer
+#[derive(Debug, Clone)]
+pub struct TransferOptions {
+    /// Number of chunks read ahead of the sender and coalesced per write
+    pub queue_depth: usize,
+    
+    /// Size of each chunk read from disk in bytes
+    pub chunk_size: usize,
+    
+    /// How file data is moved from disk to the connection
+    pub backend: crate::file_transfer::SendBackend,
+    
+    /// Copy the file to the socket inside the kernel where the transport
+    /// supports it, falling back to the pipeline elsewhere
+    pub zero_copy: bool,
+    
+    /// Minimum pipe size in bytes for the splice backend
+    pub pipe_size: Option<usize>,
+    
+    /// Read the file on a dedicated blocking thread regardless of its filesystem
+    pub force_async: bool,
+    
+    /// Allow sending the file without encryption while encryption is enabled
+    pub unencrypted: bool,
+}
+
+impl Default for TransferOptions {
+    fn default() -> Self {
+        Self {
+            queue_depth: crate::file_transfer::pipeline::DEFAULT_QUEUE_DEPTH,
+            chunk_size: crate::file_transfer::pipeline::DEFAULT_CHUNK_SIZE,
+            backend: crate::file_transfer::SendBackend::Auto,
+            zero_copy: false,
+            pipe_size: None,
+            force_async: false,
+            unencrypted: false,
+        }
+    }
+}
+
 /// Configuration for media streaming
 #[derive(Debug, Clone)]
 pub struct StreamConfig {
@@ -365,4 +365,287 @@ mod tests {
         let runtime = instance.runtime();
         assert!(runtime.config().worker_threads.is_some(), "Runtime should have worker threads configured");
     }
+    
+    #[tokio::test]
+    async fn test_transfer_file_end_to_end() {
+        use super::super::api::TransferOptions;
+        use super::super::events::PeerId;
+        use std::io::Write;
+        use tokio::io::AsyncReadExt;
+        
+        let config = create_test_config();
+        let instance = KizunaInstance::new(config).unwrap();
+        instance.initialize_systems().await.unwrap();
+        
+        // Peer that accepts one connection and reads the whole file
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let peer_socket = listener.local_addr().unwrap();
+        let contents: Vec<u8> = (0..1_000_000u32).map(|i| (i % 251) as u8).collect();
+        let expected_len = contents.len();
+        let receiver = tokio::spawn(async move {
+            let (mut socket, _) = listener.accept().await.unwrap();
+            let mut received = vec![0u8; expected_len];
+            socket.read_exact(&mut received).await.unwrap();
+            received
+        });
+        
+        let peer_id = PeerId::from("receiver");
+        instance.peer_addresses.write().await.insert(
+            peer_id.clone(),
+            KizunaInstance::transport_address(&peer_id, vec![peer_socket]),
+        );
+        
+        let mut file = tempfile::NamedTempFile::new().unwrap();
+        file.write_all(&contents).unwrap();
+        
+        let options = TransferOptions { unencrypted: true, ..TransferOptions::default() };
+        let handle = instance
+            .transfer_file_with_options(file.path().to_path_buf(), peer_id.clone(), options)
+            .await
+            .expect("Transfer should start over a pooled connection");
+        
+        let bytes_sent = handle.done().await.expect("Transfer should complete");
+        assert_eq!(bytes_sent, contents.len() as u64);
+        assert_eq!(receiver.await.unwrap(), contents, "Peer should receive the file unchanged");
+    }
+    
+    #[tokio::test]
+    async fn test_transfer_file_requires_unencrypted_opt_in() {
+        use super::super::api::TransferOptions;
+        use super::super::events::PeerId;
+        
+        let config = create_test_config();
+        let instance = KizunaInstance::new(config).unwrap();
+        instance.initialize_systems().await.unwrap();
+        
+        let file = tempfile::NamedTempFile::new().unwrap();
+        let result = instance
+            .transfer_file_with_options(file.path().to_path_buf(), PeerId::from("receiver"), TransferOptions::default())
+            .await;
+        assert!(result.is_err(), "Plaintext transfers should need an explicit opt-in");
+    }
+    
+    #[tokio::test]
+    async fn test_refused_transfer_does_not_connect() {
+        use super::super::api::TransferOptions;
+        use super::super::events::PeerId;
+        
+        let config = create_test_config();
+        let instance = KizunaInstance::new(config).unwrap();
+        instance.initialize_systems().await.unwrap();
+        
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let peer_id = PeerId::from("receiver");
+        instance.peer_addresses.write().await.insert(
+            peer_id.clone(),
+            KizunaInstance::transport_address(&peer_id, vec![listener.local_addr().unwrap()]),
+        );
+        
+        let missing = tempfile::tempdir().unwrap().path().join("missing");
+        let options = TransferOptions { unencrypted: true, ..TransferOptions::default() };
+        let result = instance.transfer_file_with_options(missing, peer_id.clone(), options).await;
+        assert!(result.is_err(), "Transfer of a missing file should fail");
+        
+        let file = tempfile::NamedTempFile::new().unwrap();
+        let result = instance
+            .transfer_file_with_options(file.path().to_path_buf(), peer_id, TransferOptions::default())
+            .await;
+        assert!(result.is_err(), "Transfer without the unencrypted opt-in should fail");
+        
+        let accepted = tokio::time::timeout(Duration::from_millis(100), listener.accept()).await;
+        assert!(accepted.is_err(), "Refused transfers should not open a connection");
+    }
+    
+    #[tokio::test]
+    async fn test_second_transfer_on_a_lease_is_refused() {
+        use super::super::api::TransferOptions;
+        use super::super::events::PeerId;
+        use std::io::Write;
+        use std::sync::Arc;
+        use tokio::io::AsyncReadExt;
+        
+        let config = create_test_config();
+        let instance = KizunaInstance::new(config).unwrap();
+        instance.initialize_systems().await.unwrap();
+        
+        // The peer only starts reading once told to, so the first transfer
+        // is still writing when the second one is attempted
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let peer_socket = listener.local_addr().unwrap();
+        let contents = vec![3u8; 16 * 1024 * 1024];
+        let expected_len = contents.len();
+        let (start_tx, start_rx) = tokio::sync::oneshot::channel::<()>();
+        let receiver = tokio::spawn(async move {
+            let (mut socket, _) = listener.accept().await.unwrap();
+            start_rx.await.unwrap();
+            let mut received = vec![0u8; expected_len];
+            socket.read_exact(&mut received).await.unwrap();
+        });
+        
+        let peer_id = PeerId::from("receiver");
+        instance.peer_addresses.write().await.insert(
+            peer_id.clone(),
+            KizunaInstance::transport_address(&peer_id, vec![peer_socket]),
+        );
+        
+        let mut file = tempfile::NamedTempFile::new().unwrap();
+        file.write_all(&contents).unwrap();
+        let options = TransferOptions { unencrypted: true, ..TransferOptions::default() };
+        
+        let lease = Arc::new(instance.lease_connection(peer_id).await.unwrap());
+        let first = instance.prepare_transfer(file.path().to_path_buf(), options.clone()).await.unwrap();
+        let second = instance.prepare_transfer(file.path().to_path_buf(), options).await.unwrap();
+        
+        let handle = instance.transfer_file_over(Arc::clone(&lease), first).await.unwrap();
+        let refused = instance.transfer_file_over(Arc::clone(&lease), second).await;
+        assert!(refused.is_err(), "A second transfer must not interleave with the first");
+        
+        start_tx.send(()).unwrap();
+        assert_eq!(handle.done().await.unwrap(), expected_len as u64);
+        receiver.await.unwrap();
+    }
+    
+    #[tokio::test]
+    async fn test_transfer_file_to_unknown_name() {
+        use super::super::api::TransferOptions;
+        
+        let config = create_test_config();
+        let instance = KizunaInstance::new(config).unwrap();
+        instance.initialize_systems().await.unwrap();
+        
+        let file = tempfile::NamedTempFile::new().unwrap();
+        let options = TransferOptions { unencrypted: true, ..TransferOptions::default() };
+        let result = instance
+            .transfer_file_to_name("no such peer", file.path().to_path_buf(), options)
+            .await;
+        assert!(result.is_err(), "Transfer should fail when no peer has the name");
+    }
+    
+    #[tokio::test]
+    async fn test_transfer_returns_lease_when_done() {
+        use super::super::api::TransferOptions;
+        use super::super::events::PeerId;
+        use std::io::Write;
+        use tokio::io::AsyncReadExt;
+        
+        let mut config = create_test_config();
+        config.networking.pool_size_per_peer = 1;
+        let instance = KizunaInstance::new(config).unwrap();
+        instance.initialize_systems().await.unwrap();
+        
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let peer_socket = listener.local_addr().unwrap();
+        let receiver = tokio::spawn(async move {
+            let (mut socket, _) = listener.accept().await.unwrap();
+            let mut received = vec![0u8; 4096];
+            socket.read_exact(&mut received).await.unwrap();
+            socket
+        });
+        
+        let peer_id = PeerId::from("receiver");
+        instance.peer_addresses.write().await.insert(
+            peer_id.clone(),
+            KizunaInstance::transport_address(&peer_id, vec![peer_socket]),
+        );
+        
+        let mut file = tempfile::NamedTempFile::new().unwrap();
+        file.write_all(&[7u8; 4096]).unwrap();
+        
+        let options = TransferOptions { unencrypted: true, ..TransferOptions::default() };
+        let handle = instance
+            .transfer_file_with_options(file.path().to_path_buf(), peer_id.clone(), options)
+            .await
+            .unwrap();
+        handle.done().await.unwrap();
+        let _socket = receiver.await.unwrap();
+        
+        // The only slot is free again and the next lease reuses the connection
+        let lease = tokio::time::timeout(Duration::from_secs(1), instance.lease_connection(peer_id))
+            .await
+            .expect("Lease should be returned once the transfer is done")
+            .unwrap();
+        assert!(lease.is_reused());
+    }
+    
+    #[tokio::test]
+    async fn test_failed_transfer_connection_is_not_reused() {
+        use super::super::api::TransferOptions;
+        use super::super::events::PeerId;
+        use std::io::Write;
+        
+        let mut config = create_test_config();
+        config.networking.pool_size_per_peer = 1;
+        let instance = KizunaInstance::new(config).unwrap();
+        instance.initialize_systems().await.unwrap();
+        
+        // The peer hangs up without reading, so the send fails part way
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let peer_socket = listener.local_addr().unwrap();
+        let acceptor = tokio::spawn(async move {
+            let (socket, _) = listener.accept().await.unwrap();
+            drop(socket);
+            let mut sockets = Vec::new();
+            while let Ok((socket, _)) = listener.accept().await {
+                sockets.push(socket);
+            }
+        });
+        
+        let peer_id = PeerId::from("receiver");
+        instance.peer_addresses.write().await.insert(
+            peer_id.clone(),
+            KizunaInstance::transport_address(&peer_id, vec![peer_socket]),
+        );
+        
+        let mut file = tempfile::NamedTempFile::new().unwrap();
+        file.write_all(&vec![5u8; 16 * 1024 * 1024]).unwrap();
+        
+        let options = TransferOptions { unencrypted: true, ..TransferOptions::default() };
+        let handle = instance
+            .transfer_file_with_options(file.path().to_path_buf(), peer_id.clone(), options)
+            .await
+            .unwrap();
+        assert!(handle.done().await.is_err(), "Send to a closed peer should fail");
+        
+        let lease = tokio::time::timeout(Duration::from_secs(1), instance.lease_connection(peer_id))
+            .await
+            .expect("The slot should be free once the failed transfer ends")
+            .unwrap();
+        assert!(!lease.is_reused(), "A connection with a partial file on it must not be reused");
+        
+        acceptor.abort();
+    }
+    
+    #[tokio::test]
+    async fn test_update_config_failure_keeps_running_systems() {
+        use super::super::events::PeerId;
+        
+        let config = create_test_config();
+        let mut instance = KizunaInstance::new(config).unwrap();
+        instance.initialize_systems().await.unwrap();
+        let original_manager = std::sync::Arc::clone(instance.system_manager());
+        
+        let peer_id = PeerId::from("receiver");
+        instance.peer_addresses.write().await.insert(
+            peer_id.clone(),
+            KizunaInstance::transport_address(&peer_id, vec!["127.0.0.1:9".parse().unwrap()]),
+        );
+        
+        // A session directory below a regular file cannot be created
+        let blocker = tempfile::NamedTempFile::new().unwrap();
+        let mut bad_config = create_test_config();
+        bad_config.file_transfer_session_dir = blocker.path().join("sessions");
+        
+        let result = instance.update_config(bad_config).await;
+        assert!(result.is_err(), "Reconfiguring should fail when the new systems cannot start");
+        assert_eq!(instance.state().await, InstanceState::Ready);
+        assert!(std::sync::Arc::ptr_eq(instance.system_manager(), &original_manager));
+        assert!(instance.system_manager().file_transfer().await.is_ok(), "Running systems should be untouched");
+        assert_eq!(instance.peer_addresses.read().await.len(), 1);
+        
+        instance.update_config(create_test_config()).await.unwrap();
+        assert!(!std::sync::Arc::ptr_eq(instance.system_manager(), &original_manager));
+        assert!(instance.system_manager().is_initialized().await);
+        assert!(!original_manager.is_initialized().await, "Replaced systems should be shut down");
+        assert!(instance.peer_addresses.read().await.is_empty(), "Peer addresses should not outlive the old transport");
+    }
 }
@@ -206,6 +206,9 @@ pub struct NetworkConfig {
     
     /// Connection timeout in seconds
     pub connection_timeout_secs: u64,
+    
+    /// Maximum pooled connections kept per peer
+    pub pool_size_per_peer: usize,
 }
 
 impl Default for NetworkConfig {
@@ -217,6 +220,7 @@ impl Default for NetworkConfig {
             enable_webrtc: true,
             enable_websocket: true,
             connection_timeout_secs: 30,
+            pool_size_per_peer: super::pool::DEFAULT_POOL_SIZE_PER_PEER,
         }
     }
 }
@@ -289,6 +293,10 @@ impl KizunaConfig {
             return Err("At least one transport protocol must be enabled".to_string());
         }
         
+        if self.networking.pool_size_per_peer == 0 {
+            return Err("Connection pool size per peer must be at least 1".to_string());
+        }
+        
         Ok(())
     }
 }
@@ -70,6 +70,12 @@ pub struct PeerInfo {
     
     /// Peer addresses
     pub addresses: Vec<std::net::SocketAddr>,
+    
+    /// Capabilities advertised by the peer
+    pub capabilities: Vec<String>,
+    
+    /// Discovery method that found the peer (e.g. "mdns", "udp")
+    pub discovery_method: String,
 }
 
 /// Transfer identifier
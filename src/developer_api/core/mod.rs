@@ -12,6 +12,7 @@ pub mod logging;
 pub mod error_recovery;
 pub mod diagnostics;
 pub mod integration;
+pub mod pool;
 
 #[cfg(test)]
 mod integration_test;
@@ -30,6 +31,7 @@ pub use logging::{Logger, LogLevel, LogRecord, ConsoleLogger, StructuredLogger};
 pub use error_recovery::{ErrorRecoveryManager, CircuitBreaker};
 pub use diagnostics::{DiagnosticTools, HealthMonitor, PerformanceMonitor, HealthStatus, DiagnosticReport};
 pub use integration::{IntegratedSystemManager, IntegratedOperations};
+pub use pool::{ConnectionPool, PooledConnection};
 
 /// Result type for core API operations
 pub type Result<T> = std::result::Result<T, KizunaError>;
@@ -0,0 +1,346 @@
+/// Per-peer connection pool shared by the operations of a Kizuna instance
+use super::events::PeerId;
+use super::KizunaError;
+use crate::transport::api::{ConnectionHandle, KizunaTransport};
+use crate::transport::PeerAddress;
+use std::collections::HashMap;
+use std::future::Future;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex};
+use tokio::sync::{OwnedSemaphorePermit, Semaphore};
+
+/// Default number of connections kept open per peer
+pub const DEFAULT_POOL_SIZE_PER_PEER: usize = 8;
+
+/// Connections held for one peer
+struct PeerSlots<C> {
+    /// Bounds how many connections to the peer may be leased at once
+    permits: Arc<Semaphore>,
+    /// Connections returned by earlier leases, most recent last
+    idle: Vec<C>,
+}
+
+type SlotMap<C> = Arc<Mutex<HashMap<PeerId, PeerSlots<C>>>>;
+
+/// Pool of reusable connections, bounded per peer
+///
+/// Peers get their slots on first use. A lease waits while all of a peer's
+/// slots are out, then hands back an idle connection if one exists and only
+/// opens a new one otherwise.
+pub struct ConnectionPool<C = ConnectionHandle> {
+    size_per_peer: usize,
+    peers: SlotMap<C>,
+}
+
+impl<C> Clone for ConnectionPool<C> {
+    fn clone(&self) -> Self {
+        Self {
+            size_per_peer: self.size_per_peer,
+            peers: Arc::clone(&self.peers),
+        }
+    }
+}
+
+impl<C> ConnectionPool<C> {
+    /// Creates a pool holding at most `size_per_peer` connections per peer
+    pub fn new(size_per_peer: usize) -> Self {
+        Self {
+            size_per_peer: size_per_peer.max(1),
+            peers: Arc::new(Mutex::new(HashMap::new())),
+        }
+    }
+
+    /// Maximum number of connections per peer
+    pub fn size_per_peer(&self) -> usize {
+        self.size_per_peer
+    }
+
+    /// Leases a connection to `peer_id`, calling `connect` only when no idle
+    /// connection is available
+    pub async fn lease<F, Fut>(&self, peer_id: &PeerId, connect: F) -> Result<PooledConnection<C>, KizunaError>
+    where
+        F: FnOnce() -> Fut,
+        Fut: Future<Output = Result<C, KizunaError>>,
+    {
+        let permits = {
+            let mut peers = self.peers.lock().unwrap();
+            let slots = peers.entry(peer_id.clone()).or_insert_with(|| PeerSlots {
+                permits: Arc::new(Semaphore::new(self.size_per_peer)),
+                idle: Vec::new(),
+            });
+            Arc::clone(&slots.permits)
+        };
+
+        let permit = permits.acquire_owned().await
+            .map_err(|_| KizunaError::state("Connection pool is closed"))?;
+
+        let idle = self.peers.lock().unwrap()
+            .get_mut(peer_id)
+            .and_then(|slots| slots.idle.pop());
+
+        let (connection, reused) = match idle {
+            Some(connection) => (connection, true),
+            None => (connect().await?, false),
+        };
+
+        Ok(PooledConnection {
+            peer_id: peer_id.clone(),
+            connection: Some(connection),
+            reused,
+            transferring: AtomicBool::new(false),
+            poisoned: AtomicBool::new(false),
+            peers: Arc::clone(&self.peers),
+            _permit: permit,
+        })
+    }
+
+    /// Number of idle connections currently held for `peer_id`
+    pub fn idle_count(&self, peer_id: &PeerId) -> usize {
+        self.peers.lock().unwrap()
+            .get(peer_id)
+            .map_or(0, |slots| slots.idle.len())
+    }
+
+    /// Drops every idle connection
+    ///
+    /// Outstanding leases stay valid and are returned as usual.
+    pub fn clear(&self) {
+        for slots in self.peers.lock().unwrap().values_mut() {
+            slots.idle.clear();
+        }
+    }
+}
+
+impl ConnectionPool {
+    /// Leases a transport connection to the peer at `peer_address`
+    ///
+    /// Idle connections that have dropped since they were returned are
+    /// discarded in favour of the next one, or a fresh connection.
+    pub async fn lease_from(&self, transport: &KizunaTransport, peer_address: &PeerAddress) -> Result<PooledConnection, KizunaError> {
+        let peer_id = PeerId::from(peer_address.peer_id.clone());
+
+        loop {
+            let lease = self.lease(&peer_id, || async {
+                transport.connect_to_peer(peer_address).await
+                    .map_err(|e| KizunaError::transport(format!("Connection failed: {}", e)))
+            }).await?;
+
+            if !lease.is_reused() || lease.connection().is_connected().await {
+                return Ok(lease);
+            }
+
+            lease.discard();
+        }
+    }
+}
+
+/// Connection leased from a `ConnectionPool`
+///
+/// Dropping the lease returns the connection to the pool; use `discard` or
+/// `poison` for connections that must not be handed out again.
+pub struct PooledConnection<C = ConnectionHandle> {
+    peer_id: PeerId,
+    connection: Option<C>,
+    reused: bool,
+    /// Set while a transfer is writing to the connection
+    transferring: AtomicBool,
+    /// Set once the connection may carry partial data
+    poisoned: AtomicBool,
+    peers: SlotMap<C>,
+    _permit: OwnedSemaphorePermit,
+}
+
+impl<C> PooledConnection<C> {
+    /// Gets the peer ID
+    pub fn peer_id(&self) -> &PeerId {
+        &self.peer_id
+    }
+
+    /// Gets the leased connection
+    pub fn connection(&self) -> &C {
+        self.connection.as_ref().expect("connection is present until the lease ends")
+    }
+
+    /// Whether the connection was taken from the idle set rather than opened
+    pub fn is_reused(&self) -> bool {
+        self.reused
+    }
+
+    /// Claims the connection for a transfer
+    ///
+    /// Transfers write their data in several batches, so two on one
+    /// connection would interleave on the wire; a second claim fails until
+    /// `end_transfer` releases the first.
+    pub fn begin_transfer(&self) -> Result<(), KizunaError> {
+        self.transferring
+            .compare_exchange(false, true, Ordering::AcqRel, Ordering::Acquire)
+            .map(|_| ())
+            .map_err(|_| KizunaError::state("A transfer is already running on this connection"))
+    }
+    
+    /// Releases the claim taken by `begin_transfer`
+    pub fn end_transfer(&self) {
+        self.transferring.store(false, Ordering::Release);
+    }
+    
+    /// Marks the connection as unusable, so it is dropped instead of
+    /// returned to the pool when the lease ends
+    ///
+    /// Unlike `discard` this works through a shared reference, for leases
+    /// still held elsewhere.
+    pub fn poison(&self) {
+        self.poisoned.store(true, Ordering::Release);
+    }
+    
+    /// Whether `poison` has been called
+    pub fn is_poisoned(&self) -> bool {
+        self.poisoned.load(Ordering::Acquire)
+    }
+    
+    /// Ends the lease without returning the connection to the pool
+    pub fn discard(mut self) -> C {
+        self.connection.take().expect("connection is present until the lease ends")
+    }
+}
+
+impl<C> Drop for PooledConnection<C> {
+    fn drop(&mut self) {
+        if self.is_poisoned() {
+            return;
+        }
+        if let Some(connection) = self.connection.take() {
+            if let Ok(mut peers) = self.peers.lock() {
+                if let Some(slots) = peers.get_mut(&self.peer_id) {
+                    slots.idle.push(connection);
+                }
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    async fn lease(pool: &ConnectionPool<usize>, peer: &PeerId, opened: &AtomicUsize) -> PooledConnection<usize> {
+        pool.lease(peer, || async { Ok(opened.fetch_add(1, Ordering::SeqCst)) }).await.unwrap()
+    }
+
+    #[tokio::test]
+    async fn test_released_connection_is_reused() {
+        let pool = ConnectionPool::new(2);
+        let peer = PeerId::from("peer");
+        let opened = AtomicUsize::new(0);
+
+        let first = lease(&pool, &peer, &opened).await;
+        assert!(!first.is_reused());
+        drop(first);
+        assert_eq!(pool.idle_count(&peer), 1);
+
+        let second = lease(&pool, &peer, &opened).await;
+        assert!(second.is_reused());
+        assert_eq!(*second.connection(), 0);
+        assert_eq!(opened.load(Ordering::SeqCst), 1);
+    }
+
+    #[tokio::test]
+    async fn test_discarded_connection_is_not_reused() {
+        let pool = ConnectionPool::new(2);
+        let peer = PeerId::from("peer");
+        let opened = AtomicUsize::new(0);
+
+        lease(&pool, &peer, &opened).await.discard();
+        assert_eq!(pool.idle_count(&peer), 0);
+
+        let next = lease(&pool, &peer, &opened).await;
+        assert!(!next.is_reused());
+        assert_eq!(opened.load(Ordering::SeqCst), 2);
+    }
+
+    #[tokio::test]
+    async fn test_poisoned_connection_is_not_reused() {
+        let pool = ConnectionPool::new(2);
+        let peer = PeerId::from("peer");
+        let opened = AtomicUsize::new(0);
+
+        let shared = Arc::new(lease(&pool, &peer, &opened).await);
+        let other = Arc::clone(&shared);
+        shared.poison();
+        drop(shared);
+        drop(other);
+        assert_eq!(pool.idle_count(&peer), 0);
+
+        let next = lease(&pool, &peer, &opened).await;
+        assert!(!next.is_reused());
+    }
+
+    #[tokio::test]
+    async fn test_one_transfer_at_a_time() {
+        let pool = ConnectionPool::new(1);
+        let peer = PeerId::from("peer");
+        let opened = AtomicUsize::new(0);
+
+        let held = lease(&pool, &peer, &opened).await;
+        held.begin_transfer().unwrap();
+        assert!(held.begin_transfer().is_err());
+
+        held.end_transfer();
+        assert!(held.begin_transfer().is_ok());
+    }
+
+    #[tokio::test]
+    async fn test_lease_waits_when_peer_is_full() {
+        let pool = ConnectionPool::new(1);
+        let peer = PeerId::from("peer");
+        let opened = AtomicUsize::new(0);
+
+        let held = lease(&pool, &peer, &opened).await;
+        let blocked = tokio::time::timeout(
+            std::time::Duration::from_millis(50),
+            lease(&pool, &peer, &opened),
+        ).await;
+        assert!(blocked.is_err());
+
+        drop(held);
+        let next = lease(&pool, &peer, &opened).await;
+        assert!(next.is_reused());
+    }
+
+    #[tokio::test]
+    async fn test_lease_from_reuses_live_transport_connections() {
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let peer_address = PeerAddress::new(
+            "peer".to_string(),
+            vec![listener.local_addr().unwrap()],
+            vec!["tcp".to_string()],
+            crate::transport::TransportCapabilities::tcp(),
+        );
+        let acceptor = tokio::spawn(async move {
+            let mut sockets = Vec::new();
+            while let Ok((socket, _)) = listener.accept().await {
+                sockets.push(socket);
+            }
+        });
+
+        let transport = KizunaTransport::new().await.unwrap();
+        let pool = ConnectionPool::new(2);
+
+        let first = pool.lease_from(&transport, &peer_address).await.unwrap();
+        assert!(!first.is_reused());
+        drop(first);
+
+        let second = pool.lease_from(&transport, &peer_address).await.unwrap();
+        assert!(second.is_reused());
+
+        // A connection that closed while idle is replaced by a fresh one
+        second.connection().close().await.unwrap();
+        drop(second);
+        let third = pool.lease_from(&transport, &peer_address).await.unwrap();
+        assert!(!third.is_reused());
+        assert!(third.connection().is_connected().await);
+        assert_eq!(pool.idle_count(&PeerId::from("peer")), 0);
+
+        acceptor.abort();
+    }
+}
@@ -56,6 +56,8 @@ impl MockPeer {
             peer_id: format!("mock-{}", self.config.name).into(),
             name: self.config.name.clone(),
             addresses: vec!["127.0.0.1:0".parse().unwrap()],
+            capabilities: Vec::new(),
+            discovery_method: "mock".to_string(),
         }
     }
 }
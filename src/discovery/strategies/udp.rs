@@ -113,28 +113,10 @@ impl UdpDiscovery {
                 break;
             }
             
-            match tokio::time::timeout(remaining, socket.recv_from(&mut buf)).await {
-                Ok(Ok((n, addr))) => {
-                    // Validate message size
-                    if n == 0 || n >= buf.len() {
-                        continue;
-                    }
-
-                    let message = String::from_utf8_lossy(&buf[..n]);
-                    
-                    // Skip our own messages
-                    if message.contains(&self.peer_id) {
-                        continue;
-                    }
-                    
-                    if let Some(peer) = self.parse_peer_response(&message, addr) {
-                        // Avoid duplicate peers in the same discovery session
-                        if !seen_peer_ids.contains(&peer.peer_id) {
-                            seen_peer_ids.insert(peer.peer_id.clone());
-                            peers.push(peer);
-                        }
-                    }
-                }
+            // Wait once for the socket to become readable, then drain every
+            // reply that has queued up instead of re-arming per datagram
+            match tokio::time::timeout(remaining, socket.readable()).await {
+                Ok(Ok(())) => {}
                 Ok(Err(e)) => {
                     // Log the error but continue listening
                     eprintln!("UDP receive error: {}", e);
@@ -145,6 +127,37 @@ impl UdpDiscovery {
                     break;
                 }
             }
+
+            loop {
+                let (n, addr) = match socket.try_recv_from(&mut buf) {
+                    Ok(received) => received,
+                    Err(e) if e.kind() == std::io::ErrorKind::WouldBlock => break,
+                    Err(e) => {
+                        eprintln!("UDP receive error: {}", e);
+                        break;
+                    }
+                };
+
+                // Validate message size
+                if n == 0 || n >= buf.len() {
+                    continue;
+                }
+
+                let message = String::from_utf8_lossy(&buf[..n]);
+                
+                // Skip our own messages
+                if message.contains(&self.peer_id) {
+                    continue;
+                }
+                
+                if let Some(peer) = self.parse_peer_response(&message, addr) {
+                    // Avoid duplicate peers in the same discovery session
+                    if !seen_peer_ids.contains(&peer.peer_id) {
+                        seen_peer_ids.insert(peer.peer_id.clone());
+                        peers.push(peer);
+                    }
+                }
+            }
         }
 
         Ok(peers)
@@ -504,6 +517,31 @@ mod tests {
         }
     }
 
+    #[tokio::test]
+    async fn test_listen_drains_queued_responses() {
+        let listener = UdpSocket::bind("127.0.0.1:0").await.unwrap();
+        let port = listener.local_addr().unwrap().port();
+        drop(listener);
+
+        let discovery = UdpDiscovery::with_config(port, "self-peer".to_string(), "Self".to_string());
+        let listen = tokio::spawn(async move {
+            discovery.listen_for_responses(Duration::from_millis(500)).await
+        });
+        tokio::time::sleep(Duration::from_millis(50)).await;
+
+        let sender = UdpSocket::bind("127.0.0.1:0").await.unwrap();
+        for i in 0..5 {
+            let message = format!("KIZUNA_PEER|peer-{}|Device {}|{}", i, i, 9000 + i);
+            sender.send_to(message.as_bytes(), ("127.0.0.1", port)).await.unwrap();
+        }
+        // Duplicates and our own messages are ignored
+        sender.send_to(b"KIZUNA_PEER|peer-0|Device 0|9000", ("127.0.0.1", port)).await.unwrap();
+        sender.send_to(b"KIZUNA_PEER|self-peer|Self|9999", ("127.0.0.1", port)).await.unwrap();
+
+        let peers = listen.await.unwrap().unwrap();
+        assert_eq!(peers.len(), 5);
+    }
+
     #[tokio::test]
     async fn test_discovery_with_timeout() {
         let discovery = UdpDiscovery::new();
@@ -11,15 +11,18 @@ use crate::file_transfer::{
     progress::{ProgressTracker, ProgressCallback, EventCallback, TransferEvent},
     notification::{NotificationManager, NotificationCallback, TransferStatus, FileStatus, FileTransferState},
     incoming::{IncomingTransferManager, IncomingTransferRequest, TransferRequestDetails},
+    pipeline::{PipelineConfig, SendPipeline},
     session::SessionManager,
     transport::TransportNegotiatorImpl,
     TransportNegotiator,
     FileTransfer, TransferManager,
 };
 use crate::security::Security;
+use crate::transport::Connection;
 use async_trait::async_trait;
 use std::path::PathBuf;
 use std::sync::Arc;
+use tokio::sync::{watch, RwLock};
 
 /// Unified file transfer system
 pub struct FileTransferSystem {
@@ -156,6 +159,71 @@ impl FileTransferSystem {
         self.start_transfer(manifest, peer_id).await
     }
 
+    /// Stream a file's raw bytes to a peer over `connection` through the
+    /// batched send pipeline
+    ///
+    /// No manifest is exchanged and the data is neither framed into checksummed
+    /// chunks nor encrypted, so this is only meant for links that are already
+    /// trusted. The file is streamed in the background; the returned signal
+    /// resolves when the send finishes.
+    pub async fn send_file_unencrypted(
+        &self,
+        file_path: PathBuf,
+        peer_id: PeerId,
+        connection: Arc<RwLock<Box<dyn Connection>>>,
+        config: PipelineConfig,
+    ) -> Result<(TransferSession, TransferCompletion)> {
+        config.validate()?;
+
+        // Build manifest for single file
+        let manifest = self.build_file_manifest(file_path.clone()).await?;
+        
+        // Start transfer
+        let session = self.start_transfer(manifest, peer_id).await?;
+
+        let transport = Arc::clone(&self.transport);
+        let session_manager = Arc::clone(&self.session_manager);
+        let progress_tracker = Arc::clone(&self.progress_tracker);
+        let session_id = session.session_id;
+        let protocol = session.transport;
+        let (outcome_tx, outcome_rx) = watch::channel(None);
+
+        tokio::spawn(async move {
+            let result: Result<u64> = async {
+                let mut stream = transport.create_chunk_stream_on(connection, protocol).await;
+                session_manager
+                    .update_session_state(session_id, TransferState::Transferring)
+                    .await?;
+
+                SendPipeline::new(config)
+                    .with_progress(Arc::clone(&progress_tracker), session_id)
+                    .send_file(file_path, stream.as_mut())
+                    .await
+            }
+            .await;
+
+            let outcome = match result {
+                Ok(bytes_sent) => {
+                    let _ = session_manager
+                        .update_session_state(session_id, TransferState::Completed)
+                        .await;
+                    let _ = progress_tracker.complete_session(session_id).await;
+                    Ok(bytes_sent)
+                }
+                Err(e) => {
+                    let _ = session_manager
+                        .update_session_state(session_id, TransferState::Failed)
+                        .await;
+                    let _ = progress_tracker.fail_session(session_id, e.to_string()).await;
+                    Err(e.to_string())
+                }
+            };
+            let _ = outcome_tx.send(Some(outcome));
+        });
+
+        Ok((session, TransferCompletion { outcome: outcome_rx }))
+    }
+
     /// Send multiple files to a peer
     pub async fn send_files(
         &self,
@@ -493,6 +561,35 @@ impl SecureTransfer for FileTransferSystem {
     }
 }
 
+/// Completion signal for a file send running in the background
+#[derive(Debug, Clone)]
+pub struct TransferCompletion {
+    outcome: watch::Receiver<Option<std::result::Result<u64, String>>>,
+}
+
+impl TransferCompletion {
+    /// Wait until the transfer has finished, returning the bytes sent
+    pub async fn wait(&mut self) -> Result<u64> {
+        let outcome = self
+            .outcome
+            .wait_for(Option::is_some)
+            .await
+            .map_err(|_| FileTransferError::InternalError("Transfer task ended without an outcome".to_string()))?
+            .clone();
+
+        match outcome {
+            Some(Ok(bytes_sent)) => Ok(bytes_sent),
+            Some(Err(reason)) => Err(FileTransferError::NetworkError { reason }),
+            None => unreachable!("wait_for only returns once an outcome is set"),
+        }
+    }
+
+    /// Whether the transfer has finished
+    pub fn is_done(&self) -> bool {
+        self.outcome.borrow().is_some()
+    }
+}
+
 /// Detailed transfer statistics
 #[derive(Debug, Clone)]
 pub struct TransferStats {
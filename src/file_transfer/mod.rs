@@ -22,15 +22,17 @@ pub mod progress;
 pub mod api;
 pub mod notification;
 pub mod incoming;
+pub mod pipeline;
 
 pub use error::{FileTransferError, Result};
 pub use types::*;
-pub use api::{FileTransferSystem, TransferStats};
+pub use api::{FileTransferSystem, TransferCompletion, TransferStats};
 pub use progress::{ProgressTracker, ProgressCallback, EventCallback, TransferEvent};
 pub use notification::{NotificationManager, NotificationCallback, TransferNotification, TransferStatus, FileStatus, FileTransferState};
 pub use incoming::{IncomingTransferManager, IncomingTransferRequest, IncomingRequestState, TransferResponse, TransferRequestDetails};
 pub use security_integration::{FileTransferSecurity, SecureTransferSession, SecureTransfer};
 pub use transport_integration::{FileTransferTransport, ProtocolConfig, ConnectionPoolStats};
+pub use pipeline::{SendPipeline, PipelineConfig, SendBackend, BufferPool};
 
 use async_trait::async_trait;
 use std::path::PathBuf;
@@ -155,6 +157,20 @@ pub trait ChunkStream: Send + Sync {
 
     /// Flush the stream
     async fn flush(&mut self) -> Result<()>;
+
+    /// Send part of a file with a kernel-side copy
+    ///
+    /// Returns `Ok(None)` when the underlying transport cannot send files
+    /// directly.
+    async fn send_file(
+        &mut self,
+        _file: &std::fs::File,
+        _offset: u64,
+        _len: u64,
+        _mode: crate::transport::FileSendMode,
+    ) -> Result<Option<u64>> {
+        Ok(None)
+    }
 }
 
 /// Transport negotiator selects optimal transport protocol for file transfers
@@ -0,0 +1,701 @@
+// Send Pipeline Module
+//
+// Streams a file to a peer with a bounded number of chunk reads in flight ahead
+// of the sender, and coalesces every chunk that is ready into a single write so
+// one transport call carries many chunks instead of one call per chunk. When
+// requested and the transport supports it, the file can bypass userspace
+// entirely through sendfile(2) or splice(2); `zero_copy` asks for sendfile
+// but falls back to the pipeline on transports without it. A shared buffer pool lets chunk
+// reads and consecutive transfers reuse buffers instead of allocating.
+// Files on filesystems whose reads can stall (network and FUSE mounts, ZFS) are
+// read by a dedicated blocking thread rather than through async file reads.
+// The pipeline writes the file's bytes as-is, without framing or encryption.
+
+use crate::file_transfer::{
+    error::{FileTransferError, Result},
+    progress::ProgressTracker,
+    types::*,
+    ChunkStream,
+};
+use crate::transport::FileSendMode;
+use std::path::PathBuf;
+use std::sync::{Arc, Mutex};
+use tokio::fs::File;
+use tokio::io::AsyncReadExt;
+use tokio::sync::mpsc;
+
+/// Default number of chunk reads kept in flight ahead of the sender
+pub const DEFAULT_QUEUE_DEPTH: usize = 64;
+
+/// Default pipeline chunk size (256KB)
+pub const DEFAULT_CHUNK_SIZE: usize = 256 * 1024;
+
+/// Default number of buffers retained by a shared buffer pool
+pub const DEFAULT_POOL_BUFFERS: usize = 128;
+
+/// Chunk buffers shared across transfers
+///
+/// Buffers are allocated on first use and handed back after their chunk has
+/// been written, so the pool retains at most `capacity` buffers.
+#[derive(Clone)]
+pub struct BufferPool {
+    buffers: Arc<Mutex<Vec<Vec<u8>>>>,
+    capacity: usize,
+}
+
+impl BufferPool {
+    /// Create a pool retaining at most `capacity` buffers
+    pub fn new(capacity: usize) -> Self {
+        Self {
+            buffers: Arc::new(Mutex::new(Vec::with_capacity(capacity))),
+            capacity,
+        }
+    }
+
+    /// Take a buffer of `len` bytes, reusing a pooled one if available
+    ///
+    /// Reused buffers keep the bytes of their previous chunk, as readers
+    /// overwrite them anyway; only growth beyond the old length is zeroed.
+    pub fn take(&self, len: usize) -> Vec<u8> {
+        let buffer = self.buffers.lock().unwrap().pop();
+        match buffer {
+            Some(mut buffer) => {
+                buffer.resize(len, 0);
+                buffer
+            }
+            None => vec![0u8; len],
+        }
+    }
+
+    /// Return a buffer to the pool, dropping it if the pool is full
+    pub fn give(&self, buffer: Vec<u8>) {
+        let mut buffers = self.buffers.lock().unwrap();
+        if buffers.len() < self.capacity {
+            buffers.push(buffer);
+        }
+    }
+
+    /// Number of buffers currently idle in the pool
+    pub fn available(&self) -> usize {
+        self.buffers.lock().unwrap().len()
+    }
+
+    /// Maximum number of buffers retained
+    pub fn capacity(&self) -> usize {
+        self.capacity
+    }
+}
+
+impl Default for BufferPool {
+    fn default() -> Self {
+        Self::new(DEFAULT_POOL_BUFFERS)
+    }
+}
+
+impl std::fmt::Debug for BufferPool {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("BufferPool")
+            .field("available", &self.available())
+            .field("capacity", &self.capacity)
+            .finish()
+    }
+}
+
+/// How file data is moved from disk to the connection
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum SendBackend {
+    /// The read/write pipeline, so every pipeline option applies; kernel
+    /// copies are only used when requested explicitly, with `zero_copy` or
+    /// a kernel backend
+    Auto,
+    /// Always read chunks in userspace and write them to the transport
+    Pipeline,
+    /// Kernel-side copy with sendfile(2)
+    Sendfile,
+    /// Kernel-side copy with splice(2) through a pipe
+    Splice,
+}
+
+/// Send pipeline configuration
+#[derive(Debug, Clone)]
+pub struct PipelineConfig {
+    /// Maximum number of chunks read ahead of the sender
+    pub queue_depth: usize,
+    /// Size of each chunk read from disk
+    pub chunk_size: usize,
+    /// How file data is moved to the connection
+    pub backend: SendBackend,
+    /// With the auto backend, copy the file to the socket inside the kernel
+    /// with sendfile(2) where the transport supports it, and fall back to the
+    /// pipeline elsewhere
+    pub zero_copy: bool,
+    /// Minimum pipe size for the splice backend (None keeps the kernel default)
+    pub pipe_size: Option<usize>,
+    /// Buffer pool shared with other transfers (None allocates per transfer)
+    pub buffer_pool: Option<BufferPool>,
+    /// Always read the file on a dedicated blocking thread, even when its
+    /// filesystem is not known to stall
+    pub force_async: bool,
+}
+
+impl Default for PipelineConfig {
+    fn default() -> Self {
+        Self {
+            queue_depth: DEFAULT_QUEUE_DEPTH,
+            chunk_size: DEFAULT_CHUNK_SIZE,
+            backend: SendBackend::Auto,
+            zero_copy: false,
+            pipe_size: None,
+            buffer_pool: None,
+            force_async: false,
+        }
+    }
+}
+
+impl PipelineConfig {
+    /// Validate the pipeline configuration
+    pub fn validate(&self) -> Result<()> {
+        if self.queue_depth == 0 {
+            return Err(FileTransferError::InvalidConfiguration {
+                reason: "queue_depth must be greater than 0".to_string(),
+            });
+        }
+
+        if self.chunk_size == 0 {
+            return Err(FileTransferError::InvalidConfiguration {
+                reason: "chunk_size must be greater than 0".to_string(),
+            });
+        }
+
+        if self.pipe_size == Some(0) {
+            return Err(FileTransferError::InvalidConfiguration {
+                reason: "pipe_size must be greater than 0".to_string(),
+            });
+        }
+
+        Ok(())
+    }
+}
+
+/// Batched file send pipeline
+pub struct SendPipeline {
+    config: PipelineConfig,
+    progress: Option<(Arc<ProgressTracker>, SessionId)>,
+}
+
+impl SendPipeline {
+    /// Create a new send pipeline
+    pub fn new(config: PipelineConfig) -> Self {
+        Self {
+            config,
+            progress: None,
+        }
+    }
+
+    /// Report progress for the given session after every batch
+    pub fn with_progress(mut self, tracker: Arc<ProgressTracker>, session_id: SessionId) -> Self {
+        self.progress = Some((tracker, session_id));
+        self
+    }
+
+    /// Get the pipeline configuration
+    pub fn config(&self) -> &PipelineConfig {
+        &self.config
+    }
+
+    /// Stream a file over the chunk stream, returning the number of bytes sent
+    pub async fn send_file(&self, file_path: PathBuf, stream: &mut dyn ChunkStream) -> Result<u64> {
+        self.config.validate()?;
+
+        let file = File::open(&file_path).await.map_err(|e| FileTransferError::IoError {
+            path: file_path.clone(),
+            source: e,
+        })?;
+
+        let metadata = file.metadata().await.map_err(|e| FileTransferError::IoError {
+            path: file_path.clone(),
+            source: e,
+        })?;
+        let file_size = metadata.len();
+        let blocking_reads = self.config.force_async || has_slow_reads(&file);
+
+        // Let the kernel copy the file straight to the socket when asked to
+        let file = match self.kernel_send_mode(blocking_reads) {
+            Some(mode) => {
+                let std_file = file.into_std().await;
+                match stream.send_file(&std_file, 0, file_size, mode).await? {
+                    Some(bytes_sent) => {
+                        self.report_progress(bytes_sent).await?;
+                        return Ok(bytes_sent);
+                    }
+                    // Nothing was sent, so zero-copy sends can still use the pipeline
+                    None if self.config.backend == SendBackend::Auto => File::from_std(std_file),
+                    None => {
+                        return Err(FileTransferError::UnsupportedOperation {
+                            operation: format!("{:?} file send on this transport", self.config.backend),
+                        })
+                    }
+                }
+            }
+            None => file,
+        };
+
+        let shared_pool = self.config.buffer_pool.clone();
+
+        // The reader stays at most `queue_depth` chunks ahead of the sender
+        let (chunk_tx, mut chunk_rx) = mpsc::channel(self.config.queue_depth);
+        let chunk_size = self.config.chunk_size;
+        let reader = if blocking_reads {
+            // Keep slow reads off the async workers entirely
+            let file = file.into_std().await;
+            let pool = shared_pool.clone();
+            tokio::task::spawn_blocking(move || {
+                Self::read_chunks_blocking(file, chunk_size, pool, chunk_tx)
+            })
+        } else {
+            tokio::spawn(Self::read_chunks(file, chunk_size, shared_pool.clone(), chunk_tx))
+        };
+
+        let mut batch: Vec<Vec<u8>> = Vec::with_capacity(self.config.queue_depth);
+        let mut coalesced = Vec::new();
+        let mut bytes_sent = 0u64;
+
+        while chunk_rx.recv_many(&mut batch, self.config.queue_depth).await > 0 {
+            bytes_sent += batch.iter().map(|chunk| chunk.len() as u64).sum::<u64>();
+
+            if batch.len() == 1 {
+                stream.send(&batch[0]).await?;
+            } else {
+                // Drain every chunk that is ready and send it with a single write
+                coalesced.clear();
+                for chunk in &batch {
+                    coalesced.extend_from_slice(chunk);
+                }
+                stream.send(&coalesced).await?;
+            }
+
+            match &shared_pool {
+                Some(pool) => batch.drain(..).for_each(|chunk| pool.give(chunk)),
+                None => batch.clear(),
+            }
+
+            self.report_progress(bytes_sent).await?;
+        }
+
+        stream.flush().await?;
+
+        // Surface read errors that ended the stream early
+        match reader.await {
+            Ok(Ok(())) => Ok(bytes_sent),
+            Ok(Err(e)) => Err(FileTransferError::IoError {
+                path: file_path,
+                source: e,
+            }),
+            Err(e) => Err(FileTransferError::InternalError(format!(
+                "Chunk reader task failed: {}",
+                e
+            ))),
+        }
+    }
+
+    /// Kernel copy strategy for the configured backend, if any
+    ///
+    /// Pipeline options such as `chunk_size` and `queue_depth` have no effect
+    /// once a kernel backend is chosen, so only an explicit request picks one.
+    fn kernel_send_mode(&self, blocking_reads: bool) -> Option<FileSendMode> {
+        match self.config.backend {
+            SendBackend::Sendfile => Some(FileSendMode::Sendfile { blocking_reads }),
+            SendBackend::Splice => Some(FileSendMode::Splice {
+                pipe_size: self.config.pipe_size,
+                blocking_reads,
+            }),
+            SendBackend::Auto if self.config.zero_copy => Some(FileSendMode::Sendfile { blocking_reads }),
+            SendBackend::Auto | SendBackend::Pipeline => None,
+        }
+    }
+
+    /// Report cumulative bytes sent to the progress tracker
+    async fn report_progress(&self, bytes_sent: u64) -> Result<()> {
+        if let Some((tracker, session_id)) = &self.progress {
+            tracker.update_progress(*session_id, bytes_sent).await?;
+        }
+        Ok(())
+    }
+
+    /// Read the file in full chunks and hand them to the sender
+    ///
+    /// Chunk buffers come from the shared pool when there is one, otherwise
+    /// they are freshly allocated.
+    async fn read_chunks(
+        mut file: File,
+        chunk_size: usize,
+        shared_pool: Option<BufferPool>,
+        chunk_tx: mpsc::Sender<Vec<u8>>,
+    ) -> std::io::Result<()> {
+        loop {
+            let mut chunk = match &shared_pool {
+                Some(pool) => pool.take(chunk_size),
+                None => vec![0u8; chunk_size],
+            };
+            let mut filled = 0;
+
+            while filled < chunk_size {
+                let bytes_read = file.read(&mut chunk[filled..]).await?;
+                if bytes_read == 0 {
+                    break;
+                }
+                filled += bytes_read;
+            }
+
+            if filled == 0 {
+                return Ok(()); // End of file
+            }
+
+            chunk.truncate(filled);
+            if chunk_tx.send(chunk).await.is_err() {
+                return Ok(()); // Sender stopped early
+            }
+
+            if filled < chunk_size {
+                return Ok(());
+            }
+        }
+    }
+
+    /// Blocking-thread variant of [`Self::read_chunks`]
+    fn read_chunks_blocking(
+        mut file: std::fs::File,
+        chunk_size: usize,
+        shared_pool: Option<BufferPool>,
+        chunk_tx: mpsc::Sender<Vec<u8>>,
+    ) -> std::io::Result<()> {
+        use std::io::Read;
+
+        loop {
+            let mut chunk = match &shared_pool {
+                Some(pool) => pool.take(chunk_size),
+                None => vec![0u8; chunk_size],
+            };
+            let mut filled = 0;
+
+            while filled < chunk_size {
+                let bytes_read = file.read(&mut chunk[filled..])?;
+                if bytes_read == 0 {
+                    break;
+                }
+                filled += bytes_read;
+            }
+
+            if filled == 0 {
+                return Ok(()); // End of file
+            }
+
+            chunk.truncate(filled);
+            if chunk_tx.blocking_send(chunk).is_err() {
+                return Ok(()); // Sender stopped early
+            }
+
+            if filled < chunk_size {
+                return Ok(());
+            }
+        }
+    }
+}
+
+/// Filesystem magic numbers whose reads may run synchronously for a long time
+#[cfg(target_os = "linux")]
+const SLOW_READ_FILESYSTEMS: &[i64] = &[
+    0x2fc1_2fc1, // ZFS
+    0x6969,      // NFS
+    0x6573_5546, // FUSE
+    0xff53_4d42, // CIFS
+    0xfe53_4d42, // SMB2
+    0x0102_1997, // 9P
+];
+
+/// Whether the file lives on a filesystem known to stall reads
+#[cfg(target_os = "linux")]
+fn has_slow_reads(file: &File) -> bool {
+    nix::sys::statfs::fstatfs(file)
+        // Magic numbers are 32-bit; compare them unsigned so a 32-bit f_type
+        // such as CIFS's does not sign-extend
+        .map(|stat| SLOW_READ_FILESYSTEMS.contains(&(stat.filesystem_type().0 as u32 as i64)))
+        .unwrap_or(false)
+}
+
+#[cfg(not(target_os = "linux"))]
+fn has_slow_reads(_file: &File) -> bool {
+    false
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use async_trait::async_trait;
+    use std::io::Write;
+    use tempfile::NamedTempFile;
+
+    /// Chunk stream that records every write
+    struct RecordingStream {
+        writes: Vec<usize>,
+        data: Vec<u8>,
+    }
+
+    #[async_trait]
+    impl ChunkStream for RecordingStream {
+        async fn send(&mut self, data: &[u8]) -> Result<()> {
+            self.writes.push(data.len());
+            self.data.extend_from_slice(data);
+            Ok(())
+        }
+
+        async fn receive(&mut self, _buffer: &mut [u8]) -> Result<usize> {
+            Ok(0)
+        }
+
+        async fn flush(&mut self) -> Result<()> {
+            Ok(())
+        }
+    }
+
+    /// Chunk stream that also accepts kernel file copies
+    struct KernelCopyStream {
+        inner: RecordingStream,
+        kernel_copies: usize,
+    }
+
+    #[async_trait]
+    impl ChunkStream for KernelCopyStream {
+        async fn send(&mut self, data: &[u8]) -> Result<()> {
+            self.inner.send(data).await
+        }
+
+        async fn receive(&mut self, buffer: &mut [u8]) -> Result<usize> {
+            self.inner.receive(buffer).await
+        }
+
+        async fn flush(&mut self) -> Result<()> {
+            self.inner.flush().await
+        }
+
+        async fn send_file(
+            &mut self,
+            _file: &std::fs::File,
+            _offset: u64,
+            len: u64,
+            _mode: FileSendMode,
+        ) -> Result<Option<u64>> {
+            self.kernel_copies += 1;
+            Ok(Some(len))
+        }
+    }
+
+    #[tokio::test]
+    async fn test_pipeline_sends_whole_file() {
+        let mut file = NamedTempFile::new().unwrap();
+        let content: Vec<u8> = (0..10_000u32).map(|i| (i % 251) as u8).collect();
+        file.write_all(&content).unwrap();
+
+        let pipeline = SendPipeline::new(PipelineConfig {
+            queue_depth: 4,
+            chunk_size: 1024,
+            ..Default::default()
+        });
+        let mut stream = RecordingStream { writes: Vec::new(), data: Vec::new() };
+
+        let sent = pipeline
+            .send_file(file.path().to_path_buf(), &mut stream)
+            .await
+            .unwrap();
+
+        assert_eq!(sent, content.len() as u64);
+        assert_eq!(stream.data, content);
+        // 10 chunks must be carried by fewer writes than chunks
+        assert!(stream.writes.len() <= 10);
+    }
+
+    #[tokio::test]
+    async fn test_pipeline_empty_file() {
+        let file = NamedTempFile::new().unwrap();
+        let pipeline = SendPipeline::new(PipelineConfig::default());
+        let mut stream = RecordingStream { writes: Vec::new(), data: Vec::new() };
+
+        let sent = pipeline
+            .send_file(file.path().to_path_buf(), &mut stream)
+            .await
+            .unwrap();
+
+        assert_eq!(sent, 0);
+        assert!(stream.writes.is_empty());
+    }
+
+    #[tokio::test]
+    async fn test_pipeline_kernel_backend_unsupported() {
+        let mut file = NamedTempFile::new().unwrap();
+        file.write_all(b"hello").unwrap();
+
+        let pipeline = SendPipeline::new(PipelineConfig {
+            backend: SendBackend::Sendfile,
+            ..Default::default()
+        });
+        let mut stream = RecordingStream { writes: Vec::new(), data: Vec::new() };
+
+        let result = pipeline.send_file(file.path().to_path_buf(), &mut stream).await;
+        assert!(matches!(result, Err(FileTransferError::UnsupportedOperation { .. })));
+        assert!(stream.data.is_empty());
+    }
+
+    #[tokio::test]
+    async fn test_pipeline_auto_backend_keeps_pipeline() {
+        let mut file = NamedTempFile::new().unwrap();
+        let content: Vec<u8> = (0..10_000u32).map(|i| (i % 251) as u8).collect();
+        file.write_all(&content).unwrap();
+
+        // The stream would take a kernel copy, but auto must not ask for one
+        let pipeline = SendPipeline::new(PipelineConfig {
+            queue_depth: 2,
+            chunk_size: 1024,
+            backend: SendBackend::Auto,
+            ..Default::default()
+        });
+        let mut stream = KernelCopyStream {
+            inner: RecordingStream { writes: Vec::new(), data: Vec::new() },
+            kernel_copies: 0,
+        };
+
+        let sent = pipeline
+            .send_file(file.path().to_path_buf(), &mut stream)
+            .await
+            .unwrap();
+
+        assert_eq!(sent, content.len() as u64);
+        assert_eq!(stream.kernel_copies, 0);
+        assert_eq!(stream.inner.data, content);
+    }
+
+    #[tokio::test]
+    async fn test_pipeline_zero_copy_uses_kernel_copy() {
+        let mut file = NamedTempFile::new().unwrap();
+        file.write_all(&[1u8; 4096]).unwrap();
+
+        let pipeline = SendPipeline::new(PipelineConfig {
+            zero_copy: true,
+            ..Default::default()
+        });
+        let mut stream = KernelCopyStream {
+            inner: RecordingStream { writes: Vec::new(), data: Vec::new() },
+            kernel_copies: 0,
+        };
+
+        let sent = pipeline
+            .send_file(file.path().to_path_buf(), &mut stream)
+            .await
+            .unwrap();
+
+        assert_eq!(sent, 4096);
+        assert_eq!(stream.kernel_copies, 1);
+        assert!(stream.inner.writes.is_empty());
+    }
+
+    #[tokio::test]
+    async fn test_pipeline_zero_copy_falls_back_to_pipeline() {
+        let mut file = NamedTempFile::new().unwrap();
+        let content: Vec<u8> = (0..10_000u32).map(|i| (i % 251) as u8).collect();
+        file.write_all(&content).unwrap();
+
+        // RecordingStream has no kernel copy, so the pipeline sends the file
+        let pipeline = SendPipeline::new(PipelineConfig {
+            chunk_size: 1024,
+            zero_copy: true,
+            ..Default::default()
+        });
+        let mut stream = RecordingStream { writes: Vec::new(), data: Vec::new() };
+
+        let sent = pipeline
+            .send_file(file.path().to_path_buf(), &mut stream)
+            .await
+            .unwrap();
+
+        assert_eq!(sent, content.len() as u64);
+        assert_eq!(stream.data, content);
+    }
+
+    #[tokio::test]
+    async fn test_pipeline_reuses_shared_buffer_pool() {
+        let mut file = NamedTempFile::new().unwrap();
+        let content: Vec<u8> = (0..10_000u32).map(|i| (i % 251) as u8).collect();
+        file.write_all(&content).unwrap();
+
+        let pool = BufferPool::new(8);
+        // The second transfer reads into buffers returned by the first
+        for _ in 0..2 {
+            let pipeline = SendPipeline::new(PipelineConfig {
+                queue_depth: 2,
+                chunk_size: 1024,
+                backend: SendBackend::Pipeline,
+                buffer_pool: Some(pool.clone()),
+                ..Default::default()
+            });
+            let mut stream = RecordingStream { writes: Vec::new(), data: Vec::new() };
+
+            let sent = pipeline
+                .send_file(file.path().to_path_buf(), &mut stream)
+                .await
+                .unwrap();
+
+            assert_eq!(sent, content.len() as u64);
+            assert_eq!(stream.data, content);
+            assert!(pool.available() > 0);
+        }
+        assert!(pool.available() <= pool.capacity());
+    }
+
+    #[tokio::test]
+    async fn test_pipeline_force_async_sends_whole_file() {
+        let mut file = NamedTempFile::new().unwrap();
+        let content: Vec<u8> = (0..10_000u32).map(|i| (i % 251) as u8).collect();
+        file.write_all(&content).unwrap();
+
+        let pipeline = SendPipeline::new(PipelineConfig {
+            queue_depth: 2,
+            chunk_size: 1024,
+            force_async: true,
+            buffer_pool: Some(BufferPool::new(4)),
+            ..Default::default()
+        });
+        let mut stream = RecordingStream { writes: Vec::new(), data: Vec::new() };
+
+        let sent = pipeline
+            .send_file(file.path().to_path_buf(), &mut stream)
+            .await
+            .unwrap();
+
+        assert_eq!(sent, content.len() as u64);
+        assert_eq!(stream.data, content);
+    }
+
+    #[test]
+    fn test_buffer_pool_take_and_give() {
+        let pool = BufferPool::new(1);
+        let buffer = pool.take(16);
+        assert_eq!(buffer, vec![0u8; 16]);
+
+        pool.give(buffer);
+        pool.give(vec![1; 4]);
+        assert_eq!(pool.available(), 1);
+
+        // The pooled allocation is reused rather than refilled
+        let reused = pool.take(8);
+        assert_eq!(reused.len(), 8);
+        assert!(reused.capacity() >= 16);
+        assert_eq!(pool.available(), 0);
+    }
+
+    #[test]
+    fn test_pipeline_config_validation() {
+        assert!(PipelineConfig::default().validate().is_ok());
+        assert!(PipelineConfig { queue_depth: 0, ..Default::default() }.validate().is_err());
+        assert!(PipelineConfig { chunk_size: 0, ..Default::default() }.validate().is_err());
+        assert!(PipelineConfig { pipe_size: Some(0), ..Default::default() }.validate().is_err());
+    }
+}
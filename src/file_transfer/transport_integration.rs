@@ -9,7 +9,7 @@ use crate::file_transfer::{
     ChunkStream,
 };
 use crate::transport::{
-    Connection, PeerAddress, PeerId as TransportPeerId,
+    Connection, FileSendMode, PeerAddress, PeerId as TransportPeerId,
     TransportCapabilities as TransportCaps,
 };
 use async_trait::async_trait;
@@ -186,9 +186,19 @@ impl FileTransferTransport {
         protocol: TransportProtocol,
     ) -> Result<Box<dyn ChunkStream>> {
         let connection = self.get_connection(peer_id).await?;
+        
+        Ok(self.create_chunk_stream_on(connection, protocol).await)
+    }
+
+    /// Create a chunk stream wrapper for a connection held by the caller
+    pub async fn create_chunk_stream_on(
+        &self,
+        connection: Arc<RwLock<Box<dyn Connection>>>,
+        protocol: TransportProtocol,
+    ) -> Box<dyn ChunkStream> {
         let config = self.get_protocol_config(protocol).await;
         
-        Ok(Box::new(TransportChunkStream::new(Arc::clone(&connection), config)))
+        Box::new(TransportChunkStream::new(connection, config))
     }
 
     /// Get connection pool statistics
@@ -241,11 +251,23 @@ impl TransportChunkStream {
 impl ChunkStream for TransportChunkStream {
     async fn send(&mut self, data: &[u8]) -> Result<()> {
         let mut conn = self.connection.write().await;
-        conn.write(data)
-            .await
-            .map_err(|e| FileTransferError::NetworkError {
-                reason: format!("Failed to send data: {}", e),
-            })?;
+        let mut written = 0;
+
+        // Connections may accept a partial write, keep going until all data is out
+        while written < data.len() {
+            let n = conn.write(&data[written..])
+                .await
+                .map_err(|e| FileTransferError::NetworkError {
+                    reason: format!("Failed to send data: {}", e),
+                })?;
+
+            if n == 0 {
+                return Err(FileTransferError::NetworkError {
+                    reason: "Connection closed while sending data".to_string(),
+                });
+            }
+            written += n;
+        }
         Ok(())
     }
 
@@ -266,6 +288,21 @@ impl ChunkStream for TransportChunkStream {
                 reason: format!("Failed to flush: {}", e),
             })
     }
+
+    async fn send_file(
+        &mut self,
+        file: &std::fs::File,
+        offset: u64,
+        len: u64,
+        mode: FileSendMode,
+    ) -> Result<Option<u64>> {
+        let mut conn = self.connection.write().await;
+        conn.send_file(file, offset, len, mode)
+            .await
+            .map_err(|e| FileTransferError::NetworkError {
+                reason: format!("Failed to send file: {}", e),
+            })
+    }
 }
 
 /// Transport protocol mapper
@@ -1,10 +1,12 @@
 // Video encoding and decoding module
 //
 // Provides H.264 encoding/decoding with hardware acceleration support
-// and adaptive quality scaling.
+// and adaptive quality scaling. Encoding runs on a dedicated encoder thread
+// so blocking pipeline calls never stall the async runtime.
 
 use async_trait::async_trait;
 use std::sync::{Arc, Mutex};
+use tokio::sync::{mpsc, oneshot};
 
 use crate::streaming::{
     EncodedFrame, EncoderCapabilities, EncoderConfig, EncodingQuality, StreamError, StreamResult,
@@ -19,6 +21,16 @@ pub use encoder::{H264Encoder, HardwareAccelerator, EncoderBackend};
 pub use decoder::{H264Decoder, DecoderBackend};
 pub use performance::{EncoderPerformanceMonitor, EncoderSelector, EncoderOptimizer};
 
+/// Number of frames that may wait for the encoder thread
+const ENCODE_QUEUE_DEPTH: usize = 4;
+
+/// Frame submitted to the encoder thread
+struct EncodeJob {
+    frame: VideoFrame,
+    quality: EncodingQuality,
+    reply: oneshot::Sender<StreamResult<EncodedFrame>>,
+}
+
 /// Video codec implementation with hardware acceleration
 /// 
 /// Provides H.264 encoding and decoding with automatic hardware acceleration
@@ -30,6 +42,7 @@ pub struct VideoCodecImpl {
     decoder: Arc<Mutex<Option<H264Decoder>>>,
     config: Arc<Mutex<Option<EncoderConfig>>>,
     hardware_acceleration_enabled: bool,
+    encode_tx: Mutex<Option<mpsc::Sender<EncodeJob>>>,
 }
 
 impl VideoCodecImpl {
@@ -40,21 +53,87 @@ impl VideoCodecImpl {
             decoder: Arc::new(Mutex::new(None)),
             config: Arc::new(Mutex::new(None)),
             hardware_acceleration_enabled: false,
+            encode_tx: Mutex::new(None),
         }
     }
 
     /// Initialize encoder with current configuration
     fn init_encoder(&self) -> StreamResult<()> {
-        let config = self.config.lock().unwrap();
+        Self::init_encoder_with(&self.encoder, &self.config, self.hardware_acceleration_enabled)
+    }
+
+    fn init_encoder_with(
+        encoder: &Mutex<Option<H264Encoder>>,
+        config: &Mutex<Option<EncoderConfig>>,
+        hardware_acceleration_enabled: bool,
+    ) -> StreamResult<()> {
+        let config = config.lock().unwrap();
         let config = config.as_ref().ok_or_else(|| {
             StreamError::configuration("Encoder not configured")
         })?;
 
-        let encoder = H264Encoder::new(config.clone(), self.hardware_acceleration_enabled)?;
-        *self.encoder.lock().unwrap() = Some(encoder);
+        let new_encoder = H264Encoder::new(config.clone(), hardware_acceleration_enabled)?;
+        *encoder.lock().unwrap() = Some(new_encoder);
         Ok(())
     }
 
+    /// Get the encoder thread's job queue, starting the thread on first use
+    ///
+    /// The thread exits once the codec is dropped and the queue closes.
+    fn encode_queue(&self) -> StreamResult<mpsc::Sender<EncodeJob>> {
+        let mut encode_tx = self.encode_tx.lock().unwrap();
+        if let Some(tx) = encode_tx.as_ref().filter(|tx| !tx.is_closed()) {
+            return Ok(tx.clone());
+        }
+
+        let (tx, mut rx) = mpsc::channel::<EncodeJob>(ENCODE_QUEUE_DEPTH);
+        let encoder = Arc::clone(&self.encoder);
+        let config = Arc::clone(&self.config);
+        let hardware_acceleration_enabled = self.hardware_acceleration_enabled;
+
+        std::thread::Builder::new()
+            .name("kizuna-encoder".to_string())
+            .spawn(move || {
+                while let Some(job) = rx.blocking_recv() {
+                    let result = Self::encode_blocking(
+                        &encoder,
+                        &config,
+                        hardware_acceleration_enabled,
+                        job.frame,
+                        job.quality,
+                    );
+                    let _ = job.reply.send(result);
+                }
+            })
+            .map_err(|e| StreamError::encoding(format!("Failed to start encoder thread: {}", e)))?;
+
+        *encode_tx = Some(tx.clone());
+        Ok(tx)
+    }
+
+    /// Encode a frame on the calling thread, creating the encoder if needed
+    fn encode_blocking(
+        encoder: &Mutex<Option<H264Encoder>>,
+        config: &Mutex<Option<EncoderConfig>>,
+        hardware_acceleration_enabled: bool,
+        frame: VideoFrame,
+        quality: EncodingQuality,
+    ) -> StreamResult<EncodedFrame> {
+        let mut encoder_guard = encoder.lock().unwrap();
+        
+        if encoder_guard.is_none() {
+            drop(encoder_guard);
+            Self::init_encoder_with(encoder, config, hardware_acceleration_enabled)?;
+            encoder_guard = encoder.lock().unwrap();
+        }
+
+        let encoder = encoder_guard.as_mut().ok_or_else(|| {
+            StreamError::encoding("Encoder not initialized")
+        })?;
+
+        encoder.encode(frame, quality)
+    }
+
     /// Initialize decoder
     fn init_decoder(&self) -> StreamResult<()> {
         let decoder = H264Decoder::new(self.hardware_acceleration_enabled)?;
@@ -70,19 +149,17 @@ impl crate::streaming::VideoCodec for VideoCodecImpl {
         frame: VideoFrame,
         quality: EncodingQuality,
     ) -> StreamResult<EncodedFrame> {
-        let mut encoder_guard = self.encoder.lock().unwrap();
-        
-        if encoder_guard.is_none() {
-            drop(encoder_guard);
-            self.init_encoder()?;
-            encoder_guard = self.encoder.lock().unwrap();
-        }
+        let encode_tx = self.encode_queue()?;
+        let (reply_tx, reply_rx) = oneshot::channel();
 
-        let encoder = encoder_guard.as_mut().ok_or_else(|| {
-            StreamError::encoding("Encoder not initialized")
-        })?;
+        encode_tx
+            .send(EncodeJob { frame, quality, reply: reply_tx })
+            .await
+            .map_err(|_| StreamError::encoding("Encoder thread stopped"))?;
 
-        encoder.encode(frame, quality)
+        reply_rx
+            .await
+            .map_err(|_| StreamError::encoding("Encoder thread stopped"))?
     }
 
     async fn decode_frame(&self, data: &[u8]) -> StreamResult<VideoFrame> {
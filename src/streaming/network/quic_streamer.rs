@@ -46,6 +46,9 @@ pub struct QuicStreamerConfig {
     pub idle_timeout: Duration,
     /// Enable 0-RTT for faster connection establishment
     pub enable_0rtt: bool,
+    /// Serialize all RTP packets of a frame into one buffer and write it with
+    /// a single call instead of one write per packet
+    pub coalesce_frame_packets: bool,
 }
 
 /// Active QUIC streaming session
@@ -93,6 +96,9 @@ struct RtpHeader {
     ssrc: u32,
 }
 
+/// Size of a serialized RTP header without CSRCs
+const RTP_HEADER_SIZE: usize = 12;
+
 /// RTP packet for video frame transmission
 #[derive(Debug, Clone)]
 struct RtpPacket {
@@ -109,6 +115,7 @@ impl Default for QuicStreamerConfig {
             frame_buffer_size: 1024 * 1024, // 1MB
             idle_timeout: Duration::from_secs(30),
             enable_0rtt: true,
+            coalesce_frame_packets: true,
         }
     }
 }
@@ -214,8 +221,17 @@ impl QuicVideoStreamer {
             .ok_or_else(|| StreamError::network("Quality level stream not found"))?;
 
         // Send RTP packets over QUIC stream
-        for packet in rtp_packets {
-            self.send_rtp_packet(&mut video_stream.send_stream, packet).await?;
+        if self.config.coalesce_frame_packets {
+            let buffer = Self::serialize_rtp_packets(&rtp_packets);
+            video_stream
+                .send_stream
+                .write_all(&buffer)
+                .await
+                .map_err(|e| StreamError::network(format!("Failed to send RTP packets: {}", e)))?;
+        } else {
+            for packet in rtp_packets {
+                self.send_rtp_packet(&mut video_stream.send_stream, packet).await?;
+            }
         }
 
         // Update statistics
@@ -436,13 +452,8 @@ impl QuicVideoStreamer {
         packet: RtpPacket,
     ) -> StreamResult<()> {
         // Serialize RTP packet
-        let mut buffer = Vec::new();
-        buffer.push((packet.header.version << 6) | (packet.header.csrc_count & 0x0F));
-        buffer.push((if packet.header.marker { 0x80 } else { 0 }) | packet.header.payload_type);
-        buffer.extend_from_slice(&packet.header.sequence_number.to_be_bytes());
-        buffer.extend_from_slice(&packet.header.timestamp.to_be_bytes());
-        buffer.extend_from_slice(&packet.header.ssrc.to_be_bytes());
-        buffer.extend_from_slice(&packet.payload);
+        let mut buffer = Vec::with_capacity(RTP_HEADER_SIZE + packet.payload.len());
+        Self::write_rtp_packet(&mut buffer, &packet);
 
         // Send over QUIC stream
         send_stream
@@ -453,13 +464,35 @@ impl QuicVideoStreamer {
         Ok(())
     }
 
+    /// Serialize a frame's RTP packets back to back into one buffer
+    fn serialize_rtp_packets(packets: &[RtpPacket]) -> Vec<u8> {
+        let total_size = packets
+            .iter()
+            .map(|packet| RTP_HEADER_SIZE + packet.payload.len())
+            .sum();
+        let mut buffer = Vec::with_capacity(total_size);
+        for packet in packets {
+            Self::write_rtp_packet(&mut buffer, packet);
+        }
+        buffer
+    }
+
+    fn write_rtp_packet(buffer: &mut Vec<u8>, packet: &RtpPacket) {
+        buffer.push((packet.header.version << 6) | (packet.header.csrc_count & 0x0F));
+        buffer.push((if packet.header.marker { 0x80 } else { 0 }) | packet.header.payload_type);
+        buffer.extend_from_slice(&packet.header.sequence_number.to_be_bytes());
+        buffer.extend_from_slice(&packet.header.timestamp.to_be_bytes());
+        buffer.extend_from_slice(&packet.header.ssrc.to_be_bytes());
+        buffer.extend_from_slice(&packet.payload);
+    }
+
     fn parse_rtp_packet(data: &[u8]) -> StreamResult<Vec<u8>> {
-        if data.len() < 12 {
+        if data.len() < RTP_HEADER_SIZE {
             return Err(StreamError::network("Invalid RTP packet size"));
         }
 
         // Extract payload (skip 12-byte header)
-        Ok(data[12..].to_vec())
+        Ok(data[RTP_HEADER_SIZE..].to_vec())
     }
 
     async fn estimate_bitrate(&self, connection: &QuinnConnection) -> u32 {
@@ -535,6 +568,7 @@ mod tests {
         assert_eq!(config.video_stream_priority, 200);
         assert!(config.enable_multiplexing);
         assert!(config.enable_0rtt);
+        assert!(config.coalesce_frame_packets);
     }
 
     #[test]
@@ -552,6 +586,22 @@ mod tests {
         assert!(header.marker);
     }
 
+    #[test]
+    fn test_serialize_rtp_packets_back_to_back() {
+        let packets = vec![
+            RtpPacket { header: RtpHeader::new(0, 42, false), payload: vec![1; 1200] },
+            RtpPacket { header: RtpHeader::new(1, 42, true), payload: vec![2; 300] },
+        ];
+
+        let buffer = QuicVideoStreamer::serialize_rtp_packets(&packets);
+        assert_eq!(buffer.len(), 2 * RTP_HEADER_SIZE + 1500);
+
+        let second = &buffer[RTP_HEADER_SIZE + 1200..];
+        assert_eq!(second[1] & 0x80, 0x80);
+        assert_eq!(&second[2..4], &1u16.to_be_bytes());
+        assert_eq!(QuicVideoStreamer::parse_rtp_packet(second).unwrap(), vec![2; 300]);
+    }
+
     #[test]
     fn test_stream_multiplexer() {
         let mut multiplexer = StreamMultiplexer::new();
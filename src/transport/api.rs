@@ -204,6 +204,11 @@ impl ConnectionHandle {
         &self.peer_id
     }
     
+    /// Get the underlying connection, shared with this handle
+    pub fn shared_connection(&self) -> Arc<RwLock<Box<dyn Connection>>> {
+        Arc::clone(&self.connection)
+    }
+    
     /// Read data from the connection
     pub async fn read(&self, buffer: &mut [u8]) -> Result<usize, TransportError> {
         let mut conn = self.connection.write().await;
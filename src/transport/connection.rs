@@ -25,6 +25,37 @@ pub trait Connection: Send + Sync + std::fmt::Debug {
     
     /// Check if connection is still active
     fn is_connected(&self) -> bool;
+    
+    /// Send `len` bytes of `file` starting at `offset` with a kernel-side copy
+    ///
+    /// Returns `Ok(None)` when the connection cannot send files directly, in
+    /// which case callers should fall back to reading and writing the data.
+    async fn send_file(
+        &mut self,
+        _file: &std::fs::File,
+        _offset: u64,
+        _len: u64,
+        _mode: FileSendMode,
+    ) -> Result<Option<u64>, TransportError> {
+        Ok(None)
+    }
+}
+
+/// Kernel-side strategy used by [`Connection::send_file`]
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum FileSendMode {
+    /// Copy with `sendfile(2)`
+    Sendfile {
+        /// Keep disk reads off the async workers
+        blocking_reads: bool,
+    },
+    /// Copy with two `splice(2)` calls through a pipe of at least the given
+    /// size, grown to fit the transfer up to the system pipe size limit
+    Splice {
+        pipe_size: Option<usize>,
+        /// Keep disk reads off the async workers
+        blocking_reads: bool,
+    },
 }
 
 /// Metadata and statistics about an active connection
@@ -7,6 +7,7 @@ use super::{
     ErrorHandler, ErrorHandlerConfig, ErrorContext, ContextualError,
     TransportLogger, LoggingConfig, LogLevel, LogCategory, LogConnectionEvent, LogSecurityEvent,
     PerformanceMonitor, PerformanceConfig, OptimizationRecommendation, HealthStatus,
+    Transport, TcpTransport,
 };
 use std::net::SocketAddr;
 
@@ -464,6 +465,11 @@ impl IntegratedTransportSystem {
             Some(&peer_address.peer_id),
             None,
             || async {
+                // Direct TCP needs no negotiation, so it connects straight away
+                if peer_address.transport_hints.iter().any(|hint| hint == "tcp") {
+                    return TcpTransport::new().connect(peer_address).await;
+                }
+
                 // This is a placeholder - in a real implementation, this would use the ConnectionManager
                 // For now, return an error indicating the method needs to be implemented with actual transport logic
                 Err(TransportError::Configuration("Connection logic not yet integrated with ConnectionManager".to_string()))
@@ -480,6 +486,10 @@ impl IntegratedTransportSystem {
             Some(&peer_address.peer_id),
             Some(protocol),
             || async {
+                if protocol == "tcp" {
+                    return TcpTransport::new().connect(peer_address).await;
+                }
+
                 // This is a placeholder - in a real implementation, this would use the ConnectionManager
                 // For now, return an error indicating the method needs to be implemented with actual transport logic
                 Err(TransportError::Configuration("Protocol-specific connection logic not yet integrated with ConnectionManager".to_string()))
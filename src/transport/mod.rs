@@ -27,7 +27,7 @@ pub use manager::{
     ManagedConnection, ConnectionPool, PoolStats, ConnectionAttemptResult, 
     ConcurrentConnectionResult, DetailedConnectionStats, AvailableTransport
 };
-pub use connection::{Connection, ConnectionInfo};
+pub use connection::{Connection, ConnectionInfo, FileSendMode};
 pub use error::{TransportError, ErrorSeverity, RetryStrategy, ErrorCategory, ErrorContext, ContextualError};
 pub use error_handler::{ErrorHandler, ErrorHandlerConfig, ErrorStats, CircuitBreaker, CircuitBreakerState, ErrorHandlerHealth};
 pub use logging::{TransportLogger, LoggingConfig, LogLevel, LogCategory, LogEntry, ConnectionEvent as LogConnectionEvent, SecurityEvent as LogSecurityEvent};
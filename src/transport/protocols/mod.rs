@@ -2,6 +2,8 @@ pub mod tcp;
 pub mod quic;
 pub mod webrtc;
 pub mod websocket;
+#[cfg(target_os = "linux")]
+mod splice;
 
 pub use tcp::{TcpTransport, TcpConnection, TcpListener, TcpConfig, TcpServer, TcpServerStats};
 pub use quic::{QuicTransport, QuicConnection, QuicConfig, QuicConnectionStats, CongestionControl};
@@ -0,0 +1,252 @@
+use std::fs::File;
+use std::io;
+use std::os::fd::AsRawFd;
+use std::sync::Arc;
+
+use nix::fcntl::{fcntl, splice, FcntlArg, SpliceFFlags};
+use nix::libc;
+use nix::sys::sendfile::sendfile64;
+use tokio::io::Interest;
+use tokio::net::TcpStream;
+
+/// Largest byte count Linux moves in a single sendfile/splice call
+const MAX_COPY_PER_CALL: u64 = 0x7fff_f000;
+
+/// Default pipe capacity on Linux
+const DEFAULT_PIPE_SIZE: usize = 64 * 1024;
+
+/// System-wide limit for unprivileged pipe sizes
+const PIPE_MAX_SIZE_PATH: &str = "/proc/sys/fs/pipe-max-size";
+
+const PAGE_SIZE: usize = 4096;
+
+/// Copy `len` bytes of `file` starting at `offset` to the socket with `sendfile(2)`
+///
+/// The socket is non-blocking, so the copy is retried whenever it reports it
+/// is writable again. sendfile reads the file as part of the socket write, so
+/// with `blocking_reads` the copy goes through a pipe instead, letting the
+/// disk reads run on a blocking thread.
+pub(crate) async fn sendfile_to(
+    stream: &TcpStream,
+    file: &File,
+    offset: u64,
+    len: u64,
+    blocking_reads: bool,
+) -> io::Result<u64> {
+    if blocking_reads {
+        return splice_to(stream, file, offset, len, None, true).await;
+    }
+
+    let mut file_offset = offset as libc::off64_t;
+    let mut sent = 0u64;
+
+    while sent < len {
+        let count = (len - sent).min(MAX_COPY_PER_CALL) as usize;
+
+        stream.writable().await?;
+        match stream.try_io(Interest::WRITABLE, || {
+            sendfile64(stream, file, Some(&mut file_offset), count).map_err(io::Error::from)
+        }) {
+            Ok(0) => {
+                return Err(io::Error::new(
+                    io::ErrorKind::UnexpectedEof,
+                    "file ended before all bytes were sent",
+                ));
+            }
+            Ok(n) => sent += n as u64,
+            Err(e) if e.kind() == io::ErrorKind::WouldBlock => continue,
+            Err(e) => return Err(e),
+        }
+    }
+
+    Ok(sent)
+}
+
+/// Copy `len` bytes of `file` starting at `offset` to the socket by splicing
+/// file → pipe → socket
+///
+/// The pipe is grown to hold the whole transfer (at least `pipe_size`), capped
+/// by the system pipe size limit, so large files need few round trips. With
+/// `blocking_reads` the file → pipe step, which waits on the disk, runs on a
+/// blocking thread.
+pub(crate) async fn splice_to(
+    stream: &TcpStream,
+    file: &File,
+    offset: u64,
+    len: u64,
+    pipe_size: Option<usize>,
+    blocking_reads: bool,
+) -> io::Result<u64> {
+    let (pipe_rx, pipe_tx) = io::pipe()?;
+
+    // Handles the blocking thread can own across rounds
+    let blocking = if blocking_reads {
+        Some((Arc::new(file.try_clone()?), Arc::new(pipe_tx.try_clone()?)))
+    } else {
+        None
+    };
+
+    let wanted = pipe_size
+        .unwrap_or(DEFAULT_PIPE_SIZE)
+        .max((len.min(MAX_COPY_PER_CALL) as usize).next_multiple_of(PAGE_SIZE));
+    let capacity = resize_pipe(pipe_tx.as_raw_fd(), wanted);
+
+    let mut file_offset = offset as libc::loff_t;
+    let mut sent = 0u64;
+
+    while sent < len {
+        let count = (len - sent).min(capacity as u64) as usize;
+
+        // The pipe is drained after every round, so filling it only waits on the disk
+        let filled = match &blocking {
+            Some((file, pipe_tx)) => {
+                let (file, pipe_tx) = (Arc::clone(file), Arc::clone(pipe_tx));
+                let mut read_offset = file_offset;
+                let (filled, read_offset) = tokio::task::spawn_blocking(move || {
+                    fill_pipe(&file, &mut read_offset, &pipe_tx, count).map(|filled| (filled, read_offset))
+                })
+                .await
+                .map_err(io::Error::other)??;
+                file_offset = read_offset;
+                filled
+            }
+            None => fill_pipe(file, &mut file_offset, &pipe_tx, count)?,
+        };
+
+        if filled == 0 {
+            return Err(io::Error::new(
+                io::ErrorKind::UnexpectedEof,
+                "file ended before all bytes were sent",
+            ));
+        }
+
+        let mut drained = 0;
+        while drained < filled {
+            stream.writable().await?;
+            match stream.try_io(Interest::WRITABLE, || {
+                splice(
+                    pipe_rx.as_raw_fd(),
+                    None,
+                    stream.as_raw_fd(),
+                    None,
+                    filled - drained,
+                    SpliceFFlags::SPLICE_F_MOVE | SpliceFFlags::SPLICE_F_NONBLOCK,
+                )
+                .map_err(io::Error::from)
+            }) {
+                Ok(0) => {
+                    return Err(io::Error::new(
+                        io::ErrorKind::WriteZero,
+                        "socket closed while splicing",
+                    ));
+                }
+                Ok(n) => drained += n,
+                Err(e) if e.kind() == io::ErrorKind::WouldBlock => continue,
+                Err(e) => return Err(e),
+            }
+        }
+
+        sent += filled as u64;
+    }
+
+    Ok(sent)
+}
+
+/// Move up to `count` bytes of `file` from `offset` into the pipe
+fn fill_pipe(file: &File, offset: &mut libc::loff_t, pipe_tx: &io::PipeWriter, count: usize) -> io::Result<usize> {
+    splice(
+        file.as_raw_fd(),
+        Some(offset),
+        pipe_tx.as_raw_fd(),
+        None,
+        count,
+        SpliceFFlags::SPLICE_F_MOVE,
+    )
+    .map_err(io::Error::from)
+}
+
+/// Grow a pipe towards `wanted` bytes, returning the capacity actually in effect
+fn resize_pipe(fd: std::os::fd::RawFd, wanted: usize) -> usize {
+    let limit = std::fs::read_to_string(PIPE_MAX_SIZE_PATH)
+        .ok()
+        .and_then(|value| value.trim().parse::<usize>().ok())
+        .unwrap_or(DEFAULT_PIPE_SIZE);
+    let target = wanted.min(limit).min(i32::MAX as usize) as libc::c_int;
+
+    match fcntl(fd, FcntlArg::F_SETPIPE_SZ(target)) {
+        Ok(size) if size > 0 => size as usize,
+        _ => fcntl(fd, FcntlArg::F_GETPIPE_SZ)
+            .map(|size| size as usize)
+            .unwrap_or(DEFAULT_PIPE_SIZE),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::io::Write;
+    use tokio::io::AsyncReadExt;
+
+    /// Connected pair of loopback sockets
+    async fn loopback() -> (TcpStream, TcpStream) {
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let addr = listener.local_addr().unwrap();
+        let (client, accepted) = tokio::join!(TcpStream::connect(addr), listener.accept());
+        (client.unwrap(), accepted.unwrap().0)
+    }
+
+    fn test_file() -> (tempfile::NamedTempFile, Vec<u8>) {
+        let content: Vec<u8> = (0..300_000u32).map(|i| (i % 251) as u8).collect();
+        let mut file = tempfile::NamedTempFile::new().unwrap();
+        file.write_all(&content).unwrap();
+        (file, content)
+    }
+
+    /// Receive `len` bytes on `socket` in the background
+    fn receive(mut socket: TcpStream, len: usize) -> tokio::task::JoinHandle<Vec<u8>> {
+        tokio::spawn(async move {
+            let mut received = vec![0u8; len];
+            socket.read_exact(&mut received).await.unwrap();
+            received
+        })
+    }
+
+    #[tokio::test]
+    async fn test_sendfile_to_loopback() {
+        let (file, content) = test_file();
+        let offset = 1000;
+        let len = content.len() - offset;
+
+        for blocking_reads in [false, true] {
+            let (sender, receiver) = loopback().await;
+            let received = receive(receiver, len);
+
+            let sent = sendfile_to(&sender, file.as_file(), offset as u64, len as u64, blocking_reads)
+                .await
+                .unwrap();
+
+            assert_eq!(sent, len as u64);
+            assert_eq!(received.await.unwrap(), content[offset..]);
+        }
+    }
+
+    #[tokio::test]
+    async fn test_splice_to_loopback() {
+        let (file, content) = test_file();
+        let offset = 1000;
+        let len = content.len() - offset;
+
+        for blocking_reads in [false, true] {
+            let (sender, receiver) = loopback().await;
+            let received = receive(receiver, len);
+
+            // A small pipe forces several file -> pipe -> socket rounds
+            let sent = splice_to(&sender, file.as_file(), offset as u64, len as u64, Some(4096), blocking_reads)
+                .await
+                .unwrap();
+
+            assert_eq!(sent, len as u64);
+            assert_eq!(received.await.unwrap(), content[offset..]);
+        }
+    }
+}
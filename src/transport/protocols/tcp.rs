@@ -432,6 +432,43 @@ impl Connection for TcpConnection {
     fn is_connected(&self) -> bool {
         self.connected.load(Ordering::Relaxed)
     }
+
+    #[cfg(target_os = "linux")]
+    async fn send_file(
+        &mut self,
+        file: &std::fs::File,
+        offset: u64,
+        len: u64,
+        mode: crate::transport::FileSendMode,
+    ) -> Result<Option<u64>, TransportError> {
+        use crate::transport::FileSendMode;
+
+        if !self.connected.load(Ordering::Relaxed) {
+            return Err(TransportError::ConnectionFailed {
+                reason: "Connection is closed".to_string(),
+            });
+        }
+
+        let result = match mode {
+            FileSendMode::Sendfile { blocking_reads } => {
+                super::splice::sendfile_to(&self.stream, file, offset, len, blocking_reads).await
+            }
+            FileSendMode::Splice { pipe_size, blocking_reads } => {
+                super::splice::splice_to(&self.stream, file, offset, len, pipe_size, blocking_reads).await
+            }
+        };
+
+        match result {
+            Ok(n) => {
+                self.bytes_sent.fetch_add(n, Ordering::Relaxed);
+                Ok(Some(n))
+            }
+            Err(e) => {
+                self.connected.store(false, Ordering::Relaxed);
+                Err(TransportError::Io(e))
+            }
+        }
+    }
 }
 
 /// TCP listener for accepting incoming connections